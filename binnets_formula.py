@@ -45,15 +45,127 @@ Where:
 
 For the staircase problem: ways(n) = F(n+1) = (φⁿ⁺¹ - ψⁿ⁺¹) / √5
 
-Time Complexity: O(1) - constant time, no loops or recursion!
-Space Complexity: O(1) - constant space!
+In floating point the formula only stays exact while F(n) fits in a double's
+53-bit mantissa (n ≤ 70). Beyond that the calculator switches to the integer
+fast doubling identities derived from it:
+    F(2k) = F(k)·[2·F(k+1) - F(k)],   F(2k+1) = F(k)² + F(k+1)²
+
+Time Complexity: O(1) for n ≤ 70, O(log n) doubling steps beyond
+Space Complexity: O(1) - exact for any n
 """
 
 import math
-import argparse
 import sys
 
 
+# Mathematical constants, computed once at import
+_SQRT5 = math.sqrt(5)
+
+# φ (phi): The golden ratio - fundamental constant in mathematics
+# Appears in nature (spirals, plant growth), art, and architecture
+_PHI = (1 + _SQRT5) / 2
+
+# ψ (psi): The conjugate of phi (φ + ψ = 1)
+# As n increases, this term vanishes (|psi| < 1 means psi^n → 0)
+_PSI = 1 - _PHI
+
+# Multiplying by the reciprocal is cheaper than dividing by √5 every time
+_INV_SQRT5 = 1 / _SQRT5
+
+# Largest n for which round(φⁿ/√5) is exact in IEEE-754 double precision.
+# F(n) needs about n·log2(φ) ≈ 0.694·n bits, and the relative error of φⁿ
+# grows with n, so with a 53-bit mantissa rounding first goes wrong at
+# n = 71. Larger n are computed with exact integer fast doubling instead.
+_BINET_MAX_N = 70
+
+# F(n)/F(n-1) differs from φ by roughly φ^(-2n), so past this index the ratio
+# is φ to far more than the 10 decimals the range displays print
+_RATIO_CONVERGED_N = 40
+_PHI_RATIO_STR = f"{_PHI:.10f}"
+
+
+def _fib_fast_doubling(n):
+    """
+    Calculate the nth Fibonacci number exactly using the fast doubling identities.
+    
+    Derived from the same closed form as Binet's formula, these identities
+    stay entirely in integers:
+        F(2k)   = F(k) · [2·F(k+1) - F(k)]
+        F(2k+1) = F(k)² + F(k+1)²
+    
+    Walking the bits of n from the most significant to the least, we keep
+    the pair (F(k), F(k+1)) and double k at every step, adding one when the
+    current bit is set. That reaches F(n) in about log₂(n) steps, with no
+    rounding, for any n.
+    
+    Args:
+        n (int): The position in the Fibonacci sequence (n >= 0)
+    
+    Returns:
+        int: The nth Fibonacci number
+    """
+    # Start from (F(0), F(1)) and consume the bits of n from the top down
+    a, b = 0, 1
+    for i in range(n.bit_length() - 1, -1, -1):
+        # F(2k) = F(k) * [2*F(k+1) - F(k)]
+        c = a * (2 * b - a)
+        
+        # F(2k+1) = F(k)^2 + F(k+1)^2
+        d = a * a + b * b
+        
+        if (n >> i) & 1:
+            # Bit is 1: advance to (F(2k+1), F(2k+2))
+            a, b = d, c + d
+        else:
+            # Bit is 0: advance to (F(2k), F(2k+1))
+            a, b = c, d
+    
+    return a
+
+
+def _ratio(a, b):
+    """
+    Return a / b as a float, looking only at the leading 53 bits of each value.
+    
+    Dividing two exact integers touches every digit, but a double can only hold
+    53 bits of the answer. Shifting both operands down to their top 53 bits and
+    scaling the quotient back with ldexp keeps the cost independent of size.
+    
+    Args:
+        a (int): Numerator (>= 0)
+        b (int): Denominator (> 0)
+    
+    Returns:
+        float: The ratio a / b
+    """
+    shift_a = max(a.bit_length() - 53, 0)
+    shift_b = max(b.bit_length() - 53, 0)
+    return math.ldexp((a >> shift_a) / (b >> shift_b), shift_a - shift_b)
+
+
+def _fib_sequence(start, end):
+    """
+    Calculate F(start) through F(end) (inclusive) as a list of exact integers.
+    
+    Only the first two values are computed directly (with fast doubling);
+    every later value is the sum of the previous two, so a range of N
+    numbers costs two O(log n) seeds plus N - 2 additions.
+    
+    Args:
+        start (int): Starting index (inclusive, >= 0)
+        end (int): Ending index (inclusive, >= start)
+    
+    Returns:
+        list[int]: The Fibonacci numbers F(start), ..., F(end)
+    """
+    a, b = _fib_fast_doubling(start), _fib_fast_doubling(start + 1)
+    values = []
+    for _ in range(end - start + 1):
+        values.append(a)
+        a, b = b, a + b
+    return values
+
+
 def fibonacci_binet(n):
     """
     Calculate the nth Fibonacci number using Binet's formula.
@@ -75,11 +187,15 @@ def fibonacci_binet(n):
     
     Therefore: F(n) = (φⁿ - ψⁿ) / √5
     
-    Why does this work?
-    -------------------
-    - As n grows, ψⁿ approaches 0 (since |ψ| < 1)
-    - So F(n) ≈ φⁿ / √5 for large n
-    - The formula gives exact integer results when rounded!
+    Why does rounding φⁿ/√5 alone work?
+    -----------------------------------
+    - |ψ| < 1, so |ψⁿ/√5| < 1/√5 < 0.5 for every n ≥ 1
+    - F(n) is therefore always the integer nearest to φⁿ/√5
+    - That needs one power instead of two, and no subtraction
+    
+    A double only carries 53 bits of mantissa, so from n = 71 onward the
+    rounded value is no longer exact (see _BINET_MAX_N); those n switch to
+    integer fast doubling automatically, at the cost of one comparison.
     
     Args:
         n (int): The position in the Fibonacci sequence (n >= 0)
@@ -97,23 +213,12 @@ def fibonacci_binet(n):
     if n == 0:
         return 0
     
-    # Calculate the mathematical constants
-    sqrt5 = math.sqrt(5)
-    
-    # φ (phi): The golden ratio - fundamental constant in mathematics
-    # Appears in nature (spirals, plant growth), art, and architecture
-    phi = (1 + sqrt5) / 2
-    
-    # ψ (psi): The conjugate of phi
-    # As n increases, this term vanishes (|psi| < 1 means psi^n → 0)
-    psi = (1 - sqrt5) / 2
+    # Beyond double precision: fall back to the exact integer method
+    if n > _BINET_MAX_N:
+        return _fib_fast_doubling(n)
     
-    # Apply Binet's formula
-    # The division by √5 normalizes the result to give exact Fibonacci numbers
-    result = (phi**n - psi**n) / sqrt5
-
-    # Round to nearest integer (floating point precision may cause tiny errors)
-    return round(result)
+    # The ψⁿ term is always below 0.5 once divided by √5, so rounding absorbs it
+    return round(_PHI**n * _INV_SQRT5)
 
 
 def staircase_ways(n):
@@ -150,10 +255,11 @@ def staircase_ways(n):
     Pattern: 1, 2, 3, 5, 8, 13, 21, 34...
     This is F(n+1) where F is the standard Fibonacci sequence!
     
-    Using Binet's Formula:
-    ---------------------
-    Instead of recursion, we compute: ways(n) = F(n+1) = (φⁿ⁺¹ - ψⁿ⁺¹) / √5
-    This gives us O(1) constant time computation!
+    Computing it directly:
+    ----------------------
+    Instead of recursion, we compute ways(n) = F(n+1) = (φⁿ⁺¹ - ψⁿ⁺¹) / √5
+    exactly, using the integer fast doubling identities in O(log n) time.
+    No floating point is involved, so the answer is correct for any n.
     
     Args:
         n (int): Number of stairs (n >= 1)
@@ -168,8 +274,8 @@ def staircase_ways(n):
         raise ValueError("Number of stairs must be at least 1")
     
     # The staircase problem is equivalent to F(n+1) in standard Fibonacci
-    # We use the same Binet's formula but with (n+1)
-    return fibonacci_binet(n + 1)
+    # Go straight to the exact integer method (no float Binet + rounding)
+    return _fib_fast_doubling(n + 1)
 
 
 def display_sequence(start, end):
@@ -185,11 +291,17 @@ def display_sequence(start, end):
     print(f"{'Index':<10} {'F(n)':<20} {'Ratio to F(n-1)'}")
     print("-" * 50)
     
+    # Bind the row format once instead of re-evaluating an f-string spec per row
+    row = "{:<10} {:<20} {}".format
     prev_value = None
-    for i in range(start, end + 1):
-        value = fibonacci_binet(i)
-        ratio_str = f"{value / prev_value:.10f}" if prev_value and prev_value != 0 else "N/A"
-        print(f"{i:<10} {value:<20} {ratio_str}")
+    for i, value in enumerate(_fib_sequence(start, end), start):
+        if not prev_value:
+            ratio_str = "N/A"
+        elif i > _RATIO_CONVERGED_N:
+            ratio_str = _PHI_RATIO_STR
+        else:
+            ratio_str = f"{_ratio(value, prev_value):.10f}"
+        print(row(i, value, ratio_str))
         prev_value = value
     
     print("\nNote: The ratio converges to φ (phi) ≈ 1.618033988749...")
@@ -208,22 +320,29 @@ def display_staircase_sequence(start, end):
     print(f"{'Stairs':<10} {'Ways':<10} {'= F(n)':<15} {'Ratio to prev'}")
     print("-" * 70)
     
+    row = "{:<10} {:<10} {:<15} {}".format
     prev_value = None
-    for i in range(start, end + 1):
-        ways = staircase_ways(i)
+    for i, ways in enumerate(_fib_sequence(start + 1, end + 1), start):
         fib_equiv = f"F({i+1})"
-        ratio_str = f"{ways / prev_value:.10f}" if prev_value and prev_value != 0 else "N/A"
-        print(f"{i:<10} {ways:<10} {fib_equiv:<15} {ratio_str}")
+        if not prev_value:
+            ratio_str = "N/A"
+        elif i + 1 > _RATIO_CONVERGED_N:
+            ratio_str = _PHI_RATIO_STR
+        else:
+            ratio_str = f"{_ratio(ways, prev_value):.10f}"
+        print(row(i, ways, fib_equiv, ratio_str))
         prev_value = ways
     
     print("\nNote: ways(n) = F(n+1) in standard Fibonacci sequence")
     print("The ratio converges to φ (phi) ≈ 1.618033988749...")
 
 
-def main():
-    """Main CLI interface for Binet's formula calculator."""
+def _full_parser():
+    """Build the complete command-line parser (argparse is imported only here)."""
+    import argparse
+    
     parser = argparse.ArgumentParser(
-        description="Calculate Fibonacci numbers and solve staircase problems using Binet's formula (O(1) time)",
+        description="Calculate Fibonacci numbers and solve staircase problems using Binet's formula (exact, O(log n) time)",
         epilog="""
 Examples:
   Fibonacci mode:
@@ -275,6 +394,19 @@ Examples:
         help='Show detailed mathematical breakdown'
     )
     
+    return parser
+
+
+def main():
+    """Main CLI interface for Binet's formula calculator."""
+    # Fast path: a bare `N` only needs F(N), so skip importing and building argparse
+    argv = sys.argv[1:]
+    if len(argv) == 1 and argv[0].isascii() and argv[0].isdigit():
+        n = int(argv[0])
+        print(f"\nF({n}) = {fibonacci_binet(n)}")
+        return
+    
+    parser = _full_parser()
     args = parser.parse_args()
     
     # Handle staircase range mode
@@ -303,9 +435,6 @@ Examples:
             print(f"Equivalent to: F({args.stairs + 1}) in Fibonacci sequence")
             
             if args.verbose:
-                sqrt5 = math.sqrt(5)
-                phi = (1 + sqrt5) / 2
-                psi = (1 - sqrt5) / 2
                 n_fib = args.stairs + 1
                 
                 print("\nHow the Staircase Problem Works:")
@@ -316,24 +445,36 @@ Examples:
                 print(f"\nThis gives: ways({args.stairs}) = ways({args.stairs - 1}) + ways({args.stairs - 2})")
                 print("This is the Fibonacci recurrence relation!")
                 
-                print("\nDetailed Calculation using Binet's Formula:")
-                print("=" * 50)
-                print(f"We compute F({n_fib}) = (φ^{n_fib} - ψ^{n_fib}) / √5")
-                print(f"\n√5           = {sqrt5}")
-                print(f"φ (phi)      = {phi}")
-                print(f"ψ (psi)      = {psi}")
-                print(f"φ^{n_fib}         = {phi**n_fib}")
-                print(f"ψ^{n_fib}         = {psi**n_fib}")
-                print(f"(φ^{n_fib} - ψ^{n_fib}) = {phi**n_fib - psi**n_fib}")
-                print(f"Result/√5    = {(phi**n_fib - psi**n_fib) / sqrt5}")
-                print(f"Rounded      = {ways}")
+                # Past _BINET_MAX_N the doubles are inexact, and φ^n soon
+                # overflows a float, so only the note is shown
+                if n_fib <= _BINET_MAX_N:
+                    phi_n = _PHI**n_fib
+                    psi_n = _PSI**n_fib
+                    diff = phi_n - psi_n
+                    
+                    print("\nDetailed Calculation using Binet's Formula:")
+                    print("=" * 50)
+                    print(f"We compute F({n_fib}) = (φ^{n_fib} - ψ^{n_fib}) / √5")
+                    print(f"\n√5           = {_SQRT5}")
+                    print(f"φ (phi)      = {_PHI}")
+                    print(f"ψ (psi)      = {_PSI}")
+                    print(f"φ^{n_fib}         = {phi_n}")
+                    print(f"ψ^{n_fib}         = {psi_n}")
+                    print(f"(φ^{n_fib} - ψ^{n_fib}) = {diff}")
+                    print(f"Result/√5    = {diff * _INV_SQRT5}")
+                    print(f"Rounded      = {ways}")
+                else:
+                    print(f"\nNote: doubles are only exact up to F({_BINET_MAX_N}); "
+                          f"the exact value above comes from integer fast doubling")
                 
                 if args.stairs >= 2:
                     print("\nBuilding up from base cases:")
                     print("-" * 50)
+                    # ways(1) = 1, ways(2) = 2, then each is the sum of the previous two
+                    w, w_next = 1, 2
                     for i in range(1, min(args.stairs + 1, 6)):
-                        w = staircase_ways(i)
                         print(f"  {i} stairs → {w} way{'s' if w > 1 else ''}")
+                        w, w_next = w_next, w + w_next
                     if args.stairs > 5:
                         print(f"  ...")
                         print(f"  {args.stairs} stairs → {ways} ways")
@@ -369,26 +510,32 @@ Examples:
         print(f"\nF({args.n}) = {result}")
         
         if args.verbose and args.n > 0:
-            sqrt5 = math.sqrt(5)
-            phi = (1 + sqrt5) / 2
-            psi = (1 - sqrt5) / 2
-            
-            print("\nDetailed Calculation:")
-            print("=" * 50)
-            print(f"√5           = {sqrt5}")
-            print(f"φ (phi)      = {phi}")
-            print(f"ψ (psi)      = {psi}")
-            print(f"φ^{args.n}         = {phi**args.n}")
-            print(f"ψ^{args.n}         = {psi**args.n}")
-            print(f"(φ^{args.n} - ψ^{args.n}) = {phi**args.n - psi**args.n}")
-            print(f"Result/√5    = {(phi**args.n - psi**args.n) / sqrt5}")
-            print(f"Rounded      = {result}")
+            # Past _BINET_MAX_N the doubles are inexact, and φ^n soon
+            # overflows a float, so only the note is shown
+            if args.n <= _BINET_MAX_N:
+                phi_n = _PHI**args.n
+                psi_n = _PSI**args.n
+                diff = phi_n - psi_n
+                
+                print("\nDetailed Calculation:")
+                print("=" * 50)
+                print(f"√5           = {_SQRT5}")
+                print(f"φ (phi)      = {_PHI}")
+                print(f"ψ (psi)      = {_PSI}")
+                print(f"φ^{args.n}         = {phi_n}")
+                print(f"ψ^{args.n}         = {psi_n}")
+                print(f"(φ^{args.n} - ψ^{args.n}) = {diff}")
+                print(f"Result/√5    = {diff * _INV_SQRT5}")
+                print(f"Rounded      = {result}")
+            else:
+                print(f"\nNote: doubles are only exact up to F({_BINET_MAX_N}); "
+                      f"the exact value above comes from integer fast doubling")
             
             if args.n > 1:
-                prev = fibonacci_binet(args.n - 1)
-                print(f"\nRatio F({args.n})/F({args.n-1}) = {result/prev:.10f}")
-                print(f"Golden ratio φ = {phi:.10f}")
-                print(f"Difference from φ: {abs(result/prev - phi):.2e}")
+                ratio = _ratio(result, fibonacci_binet(args.n - 1))
+                print(f"\nRatio F({args.n})/F({args.n-1}) = {ratio:.10f}")
+                print(f"Golden ratio φ = {_PHI:.10f}")
+                print(f"Difference from φ: {abs(ratio - _PHI):.2e}")
     
     except ValueError as e:
         print(f"Error: {e}", file=sys.stderr)
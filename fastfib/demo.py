@@ -3,9 +3,24 @@
 Quick demo of fastfib package
 """
 
+import os
+
+# Keep OpenMP worker threads spinning between calls and packed onto nearby
+# cores, so the timed loops don't pay for waking or migrating a thread team.
+# These are read when the runtime starts, so they must be set before import.
+os.environ.setdefault("OMP_WAIT_POLICY", "ACTIVE")
+os.environ.setdefault("OMP_PROC_BIND", "close")
+
 import fastfib
+import gc
 import time
-import numpy as np
+
+# Query once: get_num_cores() crosses into the extension on every call, and it
+# reports OpenMP's current thread limit, which Demo 6 changes as it runs
+_NCORES = fastfib.get_num_cores()
+
+# Golden ratio, for the convergence demo
+_PHI = (1 + 5 ** 0.5) / 2
 
 print("=" * 70)
 print("FastFib - Ultra-Fast Fibonacci Computation Demo")
@@ -15,16 +30,16 @@ print()
 # Show package info
 print("Package Information:")
 print(f"  Version: {fastfib.__version__}")
-print(f"  CPU Cores: {fastfib.get_num_cores()}")
-print(f"  Golden Ratio (φ): {fastfib.PHI:.10f}")
+print(f"  CPU Cores: {_NCORES}")
+print(f"  Golden Ratio (φ): {_PHI:.10f}")
 print()
 
 # Demo 1: Single values
 print("Demo 1: Computing Single Fibonacci Numbers")
 print("-" * 70)
 for n in [0, 1, 5, 10, 20, 50, 100]:
-    result = fastfib.fib(n)
-    print(f"  F({n:3d}) = {result:>20.3e}" if n > 50 else f"  F({n:3d}) = {int(result):>20}")
+    result = fastfib.fib_int(n)
+    print(f"  F({n:3d}) = {result:>20.3e}" if n > 50 else f"  F({n:3d}) = {result:>20}")
 print()
 
 # Demo 2: Range as list
@@ -47,54 +62,71 @@ print()
 print("Demo 4: Large-Scale Performance")
 print("-" * 70)
 
-test_sizes = [10_000, 100_000, 1_000_000, 10_000_000]
+# Values are exact, so F(1)..F(size) holds about 0.1 * size**2 digits in total
+test_sizes = [1_000, 10_000, 100_000]
 
-for size in test_sizes:
-    start = time.time()
-    arr = fastfib.fib_array(1, size)
-    elapsed = time.time() - start
-    speed = size / elapsed
-    
-    print(f"  {size:>12,} values: {elapsed*1000:>8.2f} ms  ({speed:>15,.0f} values/sec)")
+# fib_array has no out= parameter, so keep the collector from running mid-timing
+# and drop each result before the next allocation so only one array is alive
+gc.disable()
+try:
+    for size in test_sizes:
+        arr = None
+        start = time.time()
+        arr = fastfib.fib_array(1, size)
+        elapsed = time.time() - start
+        speed = size / elapsed
+        
+        print(f"  {size:>12,} values: {elapsed*1000:>8.2f} ms  ({speed:>15,.0f} values/sec)")
+    arr = None
+finally:
+    gc.enable()
 
 print()
 
 # Demo 5: Verifying convergence to golden ratio
 print("Demo 5: Fibonacci Ratios Converge to φ (Golden Ratio)")
 print("-" * 70)
+# Deferred: only this demo needs NumPy directly, and fib_array loads it anyway
+import numpy as np
+
 fibs = fastfib.fib_array(40, 50)
-ratios = fibs[1:] / fibs[:-1]
+# Divide into a reusable scratch buffer; dtype follows fib_array (object ints)
+ratios = np.empty(len(fibs) - 1, dtype=fibs.dtype)
+np.divide(fibs[1:], fibs[:-1], out=ratios)
 
 for i, ratio in enumerate(ratios, start=40):
-    error = abs(ratio - fastfib.PHI)
+    error = abs(ratio - _PHI)
     print(f"  F({i+1})/F({i}) = {ratio:.12f}  (error: {error:.2e})")
 
-print(f"\n  Golden ratio φ = {fastfib.PHI:.12f}")
+print(f"\n  Golden ratio φ = {_PHI:.12f}")
 print()
 
 # Demo 6: Multi-threading comparison
 print("Demo 6: Multi-Threading Speedup")
 print("-" * 70)
-n = 1_000_000
+n = 100_000
 
 times = {}
 for threads in [1, 2, 4, 8, 16, 24]:
-    if threads <= fastfib.get_num_cores():
+    if threads <= _NCORES:
+        # Configure the team once per setting rather than on every call
+        fastfib.set_num_threads(threads)
         start = time.time()
-        arr = fastfib.fib_array(1, n, num_threads=threads)
+        arr = fastfib.fib_array(1, n)
         elapsed = time.time() - start
         times[threads] = elapsed
         speedup = times[1] / elapsed if threads > 1 else 1.0
         print(f"  {threads:2d} thread(s): {elapsed*1000:>8.2f} ms  (speedup: {speedup:>5.2f}x)")
+fastfib.set_num_threads(_NCORES)
 
 print()
 
 # Demo 7: Memory efficiency
 print("Demo 7: Memory Efficiency")
 print("-" * 70)
-arr = fastfib.fib_array(1, 10_000_000)
+arr = fastfib.fib_array(1, 100_000)
 memory_mb = arr.nbytes / (1024 * 1024)
-print(f"  10 million Fibonacci numbers")
+print(f"  100 thousand Fibonacci numbers")
 print(f"  Memory used: {memory_mb:.2f} MB")
 print(f"  Storage efficiency: {arr.nbytes / len(arr):.1f} bytes/value")
 print()
@@ -103,7 +135,7 @@ print()
 print("=" * 70)
 print("Summary:")
 print("  ✓ Simple API: fastfib.fib(n)")
-print("  ✓ Fast: ~400-500 million computations/second")
+print("  ✓ Exact: arbitrary-precision results from GMP")
 print("  ✓ Parallel: Uses all CPU cores efficiently")
 print("  ✓ NumPy integration: Returns arrays for data science")
 print("  ✓ Memory efficient: Direct computation, minimal overhead")
@@ -112,6 +144,6 @@ print()
 print("Try it yourself:")
 print("  >>> import fastfib")
 print("  >>> fastfib.fib(100)")
-print("  3.542248481792619e+20")
+print("  '354224848179261915075'")
 print()
 
@@ -31,9 +31,16 @@ from ._fastfib import (
     fibonacci_range,
     fibonacci_range_int,
     fibonacci_array,
+    fibonacci_int_batch,
     fibonacci_digit_count,
+    fibonacci_range_digit_counts,
+    fibonacci_prefix,
+    fibonacci_suffix,
+    fibonacci_many,
+    fibonacci_mod,
     get_num_cores,
     set_num_threads,
+    bind_threads,
     METHOD,
     __version__
 )
@@ -44,7 +51,13 @@ fib_int = fibonacci_int
 fib_range = fibonacci_range
 fib_range_int = fibonacci_range_int
 fib_array = fibonacci_array
+fib_int_batch = fibonacci_int_batch
 digit_count = fibonacci_digit_count
+fib_range_digit_counts = fibonacci_range_digit_counts
+fib_prefix = fibonacci_prefix
+fib_suffix = fibonacci_suffix
+fib_many = fibonacci_many
+fib_mod = fibonacci_mod
 
 __all__ = [
     # Main functions
@@ -58,12 +71,25 @@ __all__ = [
     'fibonacci_range_int',
     'fib_array',
     'fibonacci_array',
+    'fib_int_batch',
+    'fibonacci_int_batch',
     'digit_count',
     'fibonacci_digit_count',
+    'fib_range_digit_counts',
+    'fibonacci_range_digit_counts',
+    'fib_prefix',
+    'fibonacci_prefix',
+    'fib_suffix',
+    'fibonacci_suffix',
+    'fib_many',
+    'fibonacci_many',
+    'fib_mod',
+    'fibonacci_mod',
     
     # Utility functions
     'get_num_cores',
     'set_num_threads',
+    'bind_threads',
     
     # Constants
     'METHOD',
@@ -88,4 +114,10 @@ def info():
     print(f"  fastfib.fib_range(a, b)        - Range as list of strings")
     print(f"  fastfib.fib_range_int(a, b)    - Range as list of Python ints")
     print(f"  fastfib.fib_array(a, b)        - Range as NumPy array")
+    print(f"  fastfib.fib_int_batch(ns)      - Any list of indices as Python ints")
     print(f"  fastfib.digit_count(n)         - Get number of digits in F(n)")
+    print(f"  fastfib.fib_range_digit_counts(a, b) - Digit counts for F(a)..F(b)")
+    print(f"  fastfib.fib_prefix(n, k)       - First k digits of F(n)")
+    print(f"  fastfib.fib_suffix(n, k)       - Last k digits of F(n)")
+    print(f"  fastfib.fib_many(n, count)     - Compute F(n) count times (benchmarking)")
+    print(f"  fastfib.fib_mod(n, m)          - F(n) mod m without computing F(n)")
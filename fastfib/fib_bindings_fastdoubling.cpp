@@ -7,16 +7,29 @@
 #include <pybind11/pybind11.h>
 #include <pybind11/numpy.h>
 #include <pybind11/stl.h>
+#include <algorithm>
+#include <cmath>
+#include <climits>
+#include <cstdint>
+#include <limits>
 #include <vector>
 #include <string>
 #include <utility>
 #include <omp.h>
+#ifdef __linux__
+#include <sched.h>
+#endif
 #include <gmp.h>
 #include <gmpxx.h>
 
 namespace py = pybind11;
 
 // Iterative fast doubling (more efficient, avoids recursion overhead)
+// Returns (F(n), F(n+1)). Walks (F(k), L(k)) from the top bit down, where L is
+// the Lucas sequence, because its doubling identities need two multiplications
+// per bit instead of three:
+//   F(2k) = F(k) * L(k)            L(2k) = L(k)^2 - 2*(-1)^k
+//   F(k+1) = (F(k) + L(k)) / 2     L(k+1) = (5*F(k) + L(k)) / 2
 std::pair<mpz_class, mpz_class> fibonacci_fast_doubling_iterative(long long n) {
     if (n == 0) {
         return {mpz_class(0), mpz_class(1)};
@@ -30,29 +43,38 @@ std::pair<mpz_class, mpz_class> fibonacci_fast_doubling_iterative(long long n) {
         temp >>= 1;
     }
     
-    // Start from the highest bit and work down
-    mpz_class fk(0);
-    mpz_class fk1(1);
-    
-    for (int i = bit_length - 1; i >= 0; --i) {
-        // F(2k) = F(k) * [2*F(k+1) - F(k)]
-        mpz_class f2k = fk * (2 * fk1 - fk);
-        
-        // F(2k+1) = F(k+1)^2 + F(k)^2
-        mpz_class f2k1 = fk1 * fk1 + fk * fk;
+    // The highest bit gives k = 1: F(1) = L(1) = 1
+    mpz_class fk(1);
+    mpz_class lk(1);
+    mpz_class scratch;
+    bool k_odd = true;
+    
+    for (int i = bit_length - 2; i >= 0; --i) {
+        // k -> 2k
+        mpz_mul(fk.get_mpz_t(), fk.get_mpz_t(), lk.get_mpz_t());
+        mpz_mul(lk.get_mpz_t(), lk.get_mpz_t(), lk.get_mpz_t());
+        if (k_odd) {
+            mpz_add_ui(lk.get_mpz_t(), lk.get_mpz_t(), 2);
+        } else {
+            mpz_sub_ui(lk.get_mpz_t(), lk.get_mpz_t(), 2);
+        }
+        k_odd = false;
         
         if ((n >> i) & 1) {
-            // Bit is 1, so we want F(2k+1) and F(2k+2)
-            fk = f2k1;
-            fk1 = f2k + f2k1;
-        } else {
-            // Bit is 0, so we want F(2k) and F(2k+1)
-            fk = f2k;
-            fk1 = f2k1;
+            // 2k -> 2k+1 (both sums are even, so the halving is exact)
+            mpz_mul_ui(scratch.get_mpz_t(), fk.get_mpz_t(), 5);
+            mpz_add(scratch.get_mpz_t(), scratch.get_mpz_t(), lk.get_mpz_t());
+            mpz_add(fk.get_mpz_t(), fk.get_mpz_t(), lk.get_mpz_t());
+            mpz_tdiv_q_2exp(fk.get_mpz_t(), fk.get_mpz_t(), 1);
+            mpz_tdiv_q_2exp(lk.get_mpz_t(), scratch.get_mpz_t(), 1);
+            k_odd = true;
         }
     }
     
-    return {fk, fk1};
+    // F(n+1) = (F(n) + L(n)) / 2
+    mpz_add(lk.get_mpz_t(), fk.get_mpz_t(), lk.get_mpz_t());
+    mpz_tdiv_q_2exp(lk.get_mpz_t(), lk.get_mpz_t(), 1);
+    return {fk, lk};
 }
 
 // Compute exact Fibonacci number using fast doubling
@@ -65,14 +87,87 @@ inline mpz_class fibonacci_exact_gmp(long long n) {
     return fn;
 }
 
+// Below this index a single value takes a few microseconds, less than it
+// costs to hand the GIL to another thread and take it back
+constexpr long long GIL_RELEASE_MIN_N = 20000;
+
+// Run compute() with the GIL released when F(n) is large enough to be worth it
+// (the caller must hold the GIL, and compute() must not touch Python objects)
+template <typename Compute>
+auto without_gil_for(long long n, Compute compute) -> decltype(compute()) {
+    if (n < GIL_RELEASE_MIN_N) {
+        return compute();
+    }
+    py::gil_scoped_release release;
+    return compute();
+}
+
 // Compute single Fibonacci number (returns as string for arbitrary precision)
 std::string fibonacci(long long n) {
     if (n < 0) {
         throw std::invalid_argument("n must be non-negative");
     }
     
-    mpz_class result = fibonacci_exact_gmp(n);
-    return result.get_str();
+    return without_gil_for(n, [n] { return fibonacci_exact_gmp(n).get_str(); });
+}
+
+// Convert a non-negative mpz to a Python int through its raw bytes
+// Linear in the size of x (a decimal round trip is not), and not subject to
+// Python's int_max_str_digits limit. buf is scratch space reused across calls.
+py::object mpz_to_pyint(const mpz_class& x, std::vector<unsigned char>& buf) {
+    const size_t bytes = (mpz_sizeinbase(x.get_mpz_t(), 2) + 7) / 8;
+    if (buf.size() < bytes) {
+        buf.resize(bytes);
+    }
+    
+    size_t count = 0;
+    mpz_export(buf.data(), &count, -1, 1, 0, 0, x.get_mpz_t());
+    
+    PyObject* py_int = _PyLong_FromByteArray(buf.data(), count, 1, 0);
+    if (!py_int) {
+        throw py::error_already_set();
+    }
+    return py::reinterpret_steal<py::object>(py_int);
+}
+
+// Largest n with F(n) < 2^128
+constexpr long long U128_MAX_N = 186;
+
+// Fast doubling in 128-bit registers for n <= U128_MAX_N
+// Arithmetic wraps mod 2^128, which is harmless: F(n) itself fits, and the
+// only value that overflows (F(n+1) for n = 186) is never returned.
+inline unsigned __int128 fibonacci_u128(unsigned n) {
+    unsigned __int128 fk = 0;
+    unsigned __int128 fk1 = 1;
+    
+    for (int i = n ? 31 - __builtin_clz(n) : -1; i >= 0; --i) {
+        unsigned __int128 f2k = fk * (2 * fk1 - fk);
+        unsigned __int128 f2k1 = fk1 * fk1 + fk * fk;
+        
+        if ((n >> i) & 1) {
+            fk = f2k1;
+            fk1 = f2k + f2k1;
+        } else {
+            fk = f2k;
+            fk1 = f2k1;
+        }
+    }
+    
+    return fk;
+}
+
+// Convert a 128-bit value to a Python int
+py::object u128_to_pyint(unsigned __int128 value) {
+    unsigned char bytes[16];
+    for (int i = 0; i < 16; ++i) {
+        bytes[i] = static_cast<unsigned char>(value >> (8 * i));
+    }
+    
+    PyObject* py_int = _PyLong_FromByteArray(bytes, sizeof(bytes), 1, 0);
+    if (!py_int) {
+        throw py::error_already_set();
+    }
+    return py::reinterpret_steal<py::object>(py_int);
 }
 
 // Compute single Fibonacci number as Python int (arbitrary precision)
@@ -81,12 +176,85 @@ py::object fibonacci_int(long long n) {
         throw std::invalid_argument("n must be non-negative");
     }
     
-    mpz_class result = fibonacci_exact_gmp(n);
-    std::string result_str = result.get_str();
+    // Small values never touch GMP
+    if (n <= U128_MAX_N) {
+        return u128_to_pyint(fibonacci_u128(static_cast<unsigned>(n)));
+    }
     
-    // Convert string to Python int using Python C API
-    PyObject* py_int = PyLong_FromString(result_str.c_str(), nullptr, 10);
-    return py::reinterpret_steal<py::object>(py_int);
+    mpz_class result = without_gil_for(n, [n] { return fibonacci_exact_gmp(n); });
+    std::vector<unsigned char> buf;
+    return mpz_to_pyint(result, buf);
+}
+
+// Compute F(n) count times and return it once, as fibonacci_int would
+// For benchmarking: the loop stays in C++, so its time divided by count is
+// the cost of the computation itself rather than of the Python call around it.
+py::object fibonacci_many(long long n, long long count) {
+    if (n < 0) {
+        throw std::invalid_argument("n must be non-negative");
+    }
+    if (count < 1) {
+        throw std::invalid_argument("count must be positive");
+    }
+    
+    if (n <= U128_MAX_N) {
+        unsigned __int128 value = 0;
+        for (long long i = 0; i < count; ++i) {
+            // Hide the index and result from the optimizer, so the
+            // loop-invariant computation is not hoisted out of the loop
+            unsigned index = static_cast<unsigned>(n);
+            asm volatile("" : "+r"(index));
+            value = fibonacci_u128(index);
+            asm volatile("" : : "r"(&value) : "memory");
+        }
+        return u128_to_pyint(value);
+    }
+    
+    mpz_class result = without_gil_for(n, [n, count] {
+        mpz_class value;
+        for (long long i = 0; i < count; ++i) {
+            value = fibonacci_exact_gmp(n);
+        }
+        return value;
+    });
+    std::vector<unsigned char> buf;
+    return mpz_to_pyint(result, buf);
+}
+
+// Walk F(start)..F(end) and hand each value to store(i, F(start + i))
+// Contiguous values only need one fast-doubling seed per block; the rest of
+// the block follows from F(k+2) = F(k) + F(k+1), a single mpz_add per index.
+// Blocks are spread over the OpenMP team so large ranges stay parallel;
+// several blocks per thread even out the cost of the larger values at the end.
+// Short ranges use fewer, longer blocks (one seed costs far more than an add)
+// and skip the parallel region entirely when a single block is enough.
+// Runs without the GIL; store must not touch Python objects.
+constexpr long long RANGE_MIN_BLOCK = 64;
+
+template <typename Store>
+void fibonacci_range_walk(long long start, long long end, Store store) {
+    const long long total = end - start + 1;
+    const long long blocks = std::max<long long>(1, std::min<long long>(
+        total / RANGE_MIN_BLOCK, 8LL * omp_get_max_threads()));
+    const long long block_size = (total + blocks - 1) / blocks;
+    
+    // store only writes C++ containers, so other Python threads can run
+    py::gil_scoped_release release;
+    
+    #pragma omp parallel for schedule(dynamic, 1) if (blocks > 1)
+    for (long long b = 0; b < blocks; ++b) {
+        const long long first = b * block_size;
+        const long long last = std::min(total, first + block_size);
+        if (first >= last) continue;
+        
+        auto [fk, fk1] = fibonacci_fast_doubling_iterative(start + first);
+        for (long long i = first; i < last; ++i) {
+            store(i, fk);
+            // (fk, fk1) <- (fk1, fk + fk1)
+            mpz_swap(fk.get_mpz_t(), fk1.get_mpz_t());
+            mpz_add(fk1.get_mpz_t(), fk1.get_mpz_t(), fk.get_mpz_t());
+        }
+    }
 }
 
 // Compute multiple Fibonacci numbers (returns list of strings)
@@ -108,12 +276,9 @@ std::vector<std::string> fibonacci_range(long long start, long long end, int num
     const long long total = end - start + 1;
     std::vector<std::string> results(total);
     
-    #pragma omp parallel for schedule(dynamic, 10)
-    for (long long i = 0; i < total; ++i) {
-        long long n = start + i;
-        mpz_class fib = fibonacci_exact_gmp(n);
+    fibonacci_range_walk(start, end, [&](long long i, const mpz_class& fib) {
         results[i] = fib.get_str();
-    }
+    });
     
     return results;
 }
@@ -135,21 +300,17 @@ py::list fibonacci_range_int(long long start, long long end, int num_threads = -
     }
     
     const long long total = end - start + 1;
-    std::vector<std::string> results(total);
+    std::vector<mpz_class> results(total);
     
-    #pragma omp parallel for schedule(dynamic, 10)
-    for (long long i = 0; i < total; ++i) {
-        long long n = start + i;
-        mpz_class fib = fibonacci_exact_gmp(n);
-        results[i] = fib.get_str();
-    }
+    fibonacci_range_walk(start, end, [&](long long i, const mpz_class& fib) {
+        results[i] = fib;
+    });
     
-    // Convert to Python list of ints
-    py::list py_results;
-    for (const auto& str : results) {
-        // Convert string to Python int using Python C API
-        PyObject* py_int = PyLong_FromString(str.c_str(), nullptr, 10);
-        py_results.append(py::reinterpret_steal<py::object>(py_int));
+    // Convert to a preallocated Python list of ints, reusing one byte buffer
+    py::list py_results(total);
+    std::vector<unsigned char> buf;
+    for (long long i = 0; i < total; ++i) {
+        PyList_SET_ITEM(py_results.ptr(), i, mpz_to_pyint(results[i], buf).release().ptr());
     }
     
     return py_results;
@@ -172,38 +333,214 @@ py::array fibonacci_array(long long start, long long end, int num_threads = -1)
     }
     
     const long long total = end - start + 1;
-    std::vector<std::string> results(total);
+    std::vector<mpz_class> results(total);
     
-    #pragma omp parallel for schedule(dynamic, 10)
-    for (long long i = 0; i < total; ++i) {
-        long long n = start + i;
-        mpz_class fib = fibonacci_exact_gmp(n);
-        results[i] = fib.get_str();
-    }
+    fibonacci_range_walk(start, end, [&](long long i, const mpz_class& fib) {
+        results[i] = fib;
+    });
     
     // Create NumPy array of Python object type for arbitrary precision
     py::array_t<py::object> result(total);
     auto buf = result.request();
     py::object* ptr = static_cast<py::object*>(buf.ptr);
     
+    std::vector<unsigned char> bytes;
     for (long long i = 0; i < total; ++i) {
-        // Convert string to Python int using Python C API
-        PyObject* py_int = PyLong_FromString(results[i].c_str(), nullptr, 10);
-        ptr[i] = py::reinterpret_steal<py::object>(py_int);
+        ptr[i] = mpz_to_pyint(results[i], bytes);
     }
     
     return result;
 }
 
-// Get digit count for F(n) without computing the full value
+// Compute F(n) for an arbitrary list of indices (returns list of Python ints)
+// Each index is an independent fast-doubling run, so they are shared out
+// one at a time across the OpenMP team without the GIL; only the final
+// conversion to Python ints needs it back.
+py::list fibonacci_int_batch(const std::vector<long long>& ns, int num_threads = -1) {
+    for (long long n : ns) {
+        if (n < 0) {
+            throw std::invalid_argument("n must be non-negative");
+        }
+    }
+    
+    // Set number of threads
+    if (num_threads > 0) {
+        omp_set_num_threads(num_threads);
+    } else {
+        omp_set_num_threads(omp_get_max_threads());
+    }
+    
+    const long long total = static_cast<long long>(ns.size());
+    std::vector<mpz_class> results(total);
+    
+    {
+        py::gil_scoped_release release;
+        #pragma omp parallel for schedule(dynamic, 1) if (total > 1)
+        for (long long i = 0; i < total; ++i) {
+            results[i] = fibonacci_exact_gmp(ns[i]);
+        }
+    }
+    
+    py::list py_results(total);
+    std::vector<unsigned char> buf;
+    for (long long i = 0; i < total; ++i) {
+        PyList_SET_ITEM(py_results.ptr(), i, mpz_to_pyint(results[i], buf).release().ptr());
+    }
+    
+    return py_results;
+}
+
+// Exact number of decimal digits in x
+// (mpz_sizeinbase may overestimate by one for bases other than powers of 2)
+size_t exact_digit_count(const mpz_class& x) {
+    size_t digits = mpz_sizeinbase(x.get_mpz_t(), 10);
+    if (digits > 1) {
+        mpz_class lower;
+        mpz_ui_pow_ui(lower.get_mpz_t(), 10, digits - 1);
+        if (mpz_cmpabs(x.get_mpz_t(), lower.get_mpz_t()) < 0) {
+            --digits;
+        }
+    }
+    return digits;
+}
+
+// log10(phi) and log10(sqrt(5)), for the closed-form digit count
+constexpr long double LOG10_PHI = 0.20898764024997873376927208923755541682L;
+constexpr long double LOG10_SQRT5 = 0.34948500216800940239313055263775348662L;
+
+// Get digit count for F(n) without computing F(n)
+// F(n) = round(phi^n / sqrt(5)), and past F(93) the psi^n term is far below
+// double precision, so the count is floor(n*log10(phi) - log10(sqrt(5))) + 1.
+// If that lands too close to an integer for the rounding error to be ruled
+// out, fall back to the exact GMP value (in practice this never triggers).
 long long fibonacci_digit_count(long long n) {
     if (n < 0) {
         throw std::invalid_argument("n must be non-negative");
     }
-    if (n == 0) return 1;
+    
+    // F(93) is the largest value that fits in 64 bits
+    if (n <= 93) {
+        uint64_t value = static_cast<uint64_t>(fibonacci_u128(static_cast<unsigned>(n)));
+        long long digits = 1;
+        while (value >= 10) {
+            value /= 10;
+            ++digits;
+        }
+        return digits;
+    }
+    
+    const long double x = n * LOG10_PHI - LOG10_SQRT5;
+    const long double whole = std::floor(x);
+    const long double margin = 16 * std::numeric_limits<long double>::epsilon() * x;
+    if (x - whole < margin || whole + 1 - x < margin) {
+        mpz_class result = fibonacci_exact_gmp(n);
+        return exact_digit_count(result);
+    }
+    return static_cast<long long>(whole) + 1;
+}
+
+// Digit counts for F(start)..F(end)
+std::vector<long long> fibonacci_range_digit_counts(long long start, long long end, int num_threads = -1) {
+    if (start < 0 || end < 0) {
+        throw std::invalid_argument("start and end must be non-negative");
+    }
+    if (start > end) {
+        throw std::invalid_argument("start must be <= end");
+    }
+    
+    // Set number of threads
+    if (num_threads > 0) {
+        omp_set_num_threads(num_threads);
+    } else {
+        omp_set_num_threads(omp_get_max_threads());
+    }
+    
+    const long long total = end - start + 1;
+    std::vector<long long> results(total);
+    
+    // Closed form per index, so no value is ever computed
+    #pragma omp parallel for schedule(static)
+    for (long long i = 0; i < total; ++i) {
+        results[i] = fibonacci_digit_count(start + i);
+    }
+    
+    return results;
+}
+
+// Leading k decimal digits of F(n)
+// One division by a power of ten is much cheaper than the full base conversion
+std::string fibonacci_prefix(long long n, long long k) {
+    if (n < 0 || k < 0) {
+        throw std::invalid_argument("n and k must be non-negative");
+    }
     
     mpz_class result = fibonacci_exact_gmp(n);
-    return mpz_sizeinbase(result.get_mpz_t(), 10);
+    size_t digits = exact_digit_count(result);
+    if (static_cast<size_t>(k) >= digits) {
+        return result.get_str();
+    }
+    if (k == 0) {
+        return std::string();
+    }
+    
+    mpz_class scale;
+    mpz_ui_pow_ui(scale.get_mpz_t(), 10, digits - k);
+    mpz_class head;
+    mpz_tdiv_q(head.get_mpz_t(), result.get_mpz_t(), scale.get_mpz_t());
+    return head.get_str();
+}
+
+// Trailing k decimal digits of F(n) (zero-padded to exactly k digits)
+std::string fibonacci_suffix(long long n, long long k) {
+    if (n < 0 || k < 0) {
+        throw std::invalid_argument("n and k must be non-negative");
+    }
+    
+    mpz_class result = fibonacci_exact_gmp(n);
+    if (static_cast<size_t>(k) >= exact_digit_count(result)) {
+        return result.get_str();
+    }
+    if (k == 0) {
+        return std::string();
+    }
+    
+    mpz_class scale;
+    mpz_ui_pow_ui(scale.get_mpz_t(), 10, k);
+    mpz_class tail;
+    mpz_tdiv_r(tail.get_mpz_t(), result.get_mpz_t(), scale.get_mpz_t());
+    std::string tail_str = tail.get_str();
+    return std::string(k - tail_str.size(), '0') + tail_str;
+}
+
+// F(n) mod m by fast doubling on residues, without ever building F(n)
+// Residues are below 2^63, so every product fits in 128 bits before reduction.
+long long fibonacci_mod(long long n, long long m) {
+    if (n < 0) {
+        throw std::invalid_argument("n must be non-negative");
+    }
+    if (m < 1) {
+        throw std::invalid_argument("m must be positive");
+    }
+    
+    const unsigned __int128 mod = static_cast<unsigned long long>(m);
+    unsigned __int128 fk = 0;
+    unsigned __int128 fk1 = 1 % mod;
+    
+    for (int i = n ? 63 - __builtin_clzll(n) : -1; i >= 0; --i) {
+        // F(2k) = F(k) * (2*F(k+1) - F(k)), F(2k+1) = F(k+1)^2 + F(k)^2
+        unsigned __int128 f2k = fk * ((2 * fk1 + mod - fk) % mod) % mod;
+        unsigned __int128 f2k1 = (fk1 * fk1 + fk * fk) % mod;
+        
+        if ((n >> i) & 1) {
+            fk = f2k1;
+            fk1 = (f2k + f2k1) % mod;
+        } else {
+            fk = f2k;
+            fk1 = f2k1;
+        }
+    }
+    
+    return static_cast<long long>(fk);
 }
 
 // Get number of available CPU cores
@@ -219,37 +556,231 @@ void set_num_threads(int n) {
     omp_set_num_threads(n);
 }
 
+// CPUs this process may run on, captured before any thread has been pinned
+#ifdef __linux__
+const std::vector<int>& allowed_cpus() {
+    static const std::vector<int> cpus = [] {
+        std::vector<int> result;
+        cpu_set_t allowed;
+        if (sched_getaffinity(0, sizeof(allowed), &allowed) == 0) {
+            for (int cpu = 0; cpu < CPU_SETSIZE; ++cpu) {
+                if (CPU_ISSET(cpu, &allowed)) {
+                    result.push_back(cpu);
+                }
+            }
+        }
+        return result;
+    }();
+    return cpus;
+}
+#endif
+
+// Pin each thread of the OpenMP team to one CPU, round-robin over the allowed
+// CPUs, so a thread's range blocks and GMP scratch stay in that core's cache.
+// The runtime reuses its team, so the pinning persists for later parallel calls.
+// Returns the number of threads pinned (0 where affinity is not supported).
+int bind_threads(int num_threads = -1) {
+    if (num_threads > 0) {
+        omp_set_num_threads(num_threads);
+    }
+    
+#ifdef __linux__
+    const std::vector<int>& cpus = allowed_cpus();
+    if (cpus.empty()) {
+        return 0;
+    }
+    
+    int pinned = 0;
+    #pragma omp parallel reduction(+:pinned)
+    {
+        cpu_set_t mask;
+        CPU_ZERO(&mask);
+        CPU_SET(cpus[omp_get_thread_num() % cpus.size()], &mask);
+        if (sched_setaffinity(0, sizeof(mask), &mask) == 0) {
+            pinned += 1;
+        }
+    }
+    return pinned;
+#else
+    return 0;
+#endif
+}
+
+// The single-value and thread-control functions are per-call hot paths
+// (e.g. small n in a tight loop) where binding overhead exceeds the work, so
+// they are plain CPython functions (see raw_methods) instead of going through
+// pybind11's argument dispatcher; the heavier functions stay on pybind11
+
+// Take the single argument n, passed by position or as n=; sets a Python
+// TypeError and returns nullptr otherwise
+static PyObject* single_arg(const char* name, PyObject* const* args,
+                            Py_ssize_t nargs, PyObject* kwnames) {
+    Py_ssize_t nkw = kwnames ? PyTuple_GET_SIZE(kwnames) : 0;
+    if (nargs + nkw != 1) {
+        PyErr_Format(PyExc_TypeError, "%s() takes exactly one argument (%zd given)",
+                     name, nargs + nkw);
+        return nullptr;
+    }
+    if (nkw == 1) {
+        PyObject* key = PyTuple_GET_ITEM(kwnames, 0);
+        if (PyUnicode_CompareWithASCIIString(key, "n") != 0) {
+            PyErr_Format(PyExc_TypeError, "%s() got an unexpected keyword argument '%U'",
+                         name, key);
+            return nullptr;
+        }
+    }
+    return args[0];
+}
+
+// Read a non-negative index argument; sets a Python error and returns false
+// otherwise
+static bool parse_index(const char* name, PyObject* const* args,
+                        Py_ssize_t nargs, PyObject* kwnames, long long& n) {
+    PyObject* arg = single_arg(name, args, nargs, kwnames);
+    if (!arg) {
+        return false;
+    }
+    n = PyLong_AsLongLong(arg);
+    if (n == -1 && PyErr_Occurred()) {
+        return false;
+    }
+    if (n < 0) {
+        PyErr_SetString(PyExc_ValueError, "n must be non-negative");
+        return false;
+    }
+    return true;
+}
+
+static PyObject* fibonacci_raw(PyObject*, PyObject* const* args,
+                               Py_ssize_t nargs, PyObject* kwnames) {
+    long long n;
+    if (!parse_index("fibonacci", args, nargs, kwnames, n)) {
+        return nullptr;
+    }
+    
+    try {
+        std::string result = fibonacci(n);
+        return PyUnicode_FromStringAndSize(result.data(), result.size());
+    } catch (const std::bad_alloc&) {
+        PyErr_NoMemory();
+    }
+    return nullptr;
+}
+
+static PyObject* fibonacci_int_raw(PyObject*, PyObject* const* args,
+                                   Py_ssize_t nargs, PyObject* kwnames) {
+    long long n;
+    if (!parse_index("fibonacci_int", args, nargs, kwnames, n)) {
+        return nullptr;
+    }
+    
+    try {
+        return fibonacci_int(n).release().ptr();
+    } catch (py::error_already_set& e) {
+        e.restore();
+    } catch (const std::bad_alloc&) {
+        PyErr_NoMemory();
+    }
+    return nullptr;
+}
+
+static PyObject* fibonacci_digit_count_raw(PyObject*, PyObject* const* args,
+                                           Py_ssize_t nargs, PyObject* kwnames) {
+    long long n;
+    if (!parse_index("fibonacci_digit_count", args, nargs, kwnames, n)) {
+        return nullptr;
+    }
+    
+    try {
+        return PyLong_FromLongLong(fibonacci_digit_count(n));
+    } catch (const std::bad_alloc&) {
+        PyErr_NoMemory();
+    }
+    return nullptr;
+}
+
+static PyObject* get_num_cores_raw(PyObject*, PyObject*) {
+    return PyLong_FromLong(get_num_cores());
+}
+
+static PyObject* set_num_threads_raw(PyObject*, PyObject* const* args,
+                                     Py_ssize_t nargs, PyObject* kwnames) {
+    PyObject* arg = single_arg("set_num_threads", args, nargs, kwnames);
+    if (!arg) {
+        return nullptr;
+    }
+    long n = PyLong_AsLong(arg);
+    if (n == -1 && PyErr_Occurred()) {
+        return nullptr;
+    }
+    if (n <= 0 || n > INT_MAX) {
+        PyErr_SetString(PyExc_ValueError, "Number of threads must be positive");
+        return nullptr;
+    }
+    
+    set_num_threads(static_cast<int>(n));
+    Py_RETURN_NONE;
+}
+
+// PyMethodDef stores every function as a PyCFunction
+#define FASTCALL_KW(func) reinterpret_cast<PyCFunction>(reinterpret_cast<void (*)(void)>(func))
+
+static PyMethodDef raw_methods[] = {
+    {"fibonacci", FASTCALL_KW(fibonacci_raw), METH_FASTCALL | METH_KEYWORDS,
+     "fibonacci($module, n)\n--\n\n"
+     "Compute the nth Fibonacci number using fast doubling (GMP).\n\n"
+     "Args:\n"
+     "    n: Non-negative integer index\n\n"
+     "Returns:\n"
+     "    String representation of the exact nth Fibonacci number\n\n"
+     "Example:\n"
+     "    >>> fibonacci(10)\n"
+     "    '55'\n"
+     "    >>> fibonacci(100)\n"
+     "    '354224848179261915075'"},
+    {"fibonacci_int", FASTCALL_KW(fibonacci_int_raw), METH_FASTCALL | METH_KEYWORDS,
+     "fibonacci_int($module, n)\n--\n\n"
+     "Compute the nth Fibonacci number as Python int with arbitrary precision.\n\n"
+     "Args:\n"
+     "    n: Non-negative integer index\n\n"
+     "Returns:\n"
+     "    Python int with exact value\n\n"
+     "Example:\n"
+     "    >>> fibonacci_int(100)\n"
+     "    354224848179261915075"},
+    {"fibonacci_digit_count", FASTCALL_KW(fibonacci_digit_count_raw), METH_FASTCALL | METH_KEYWORDS,
+     "fibonacci_digit_count($module, n)\n--\n\n"
+     "Get the number of digits in F(n).\n\n"
+     "Uses the closed form floor(n*log10(phi) - log10(sqrt(5))) + 1,\n"
+     "so F(n) itself is never computed.\n\n"
+     "Args:\n"
+     "    n: Non-negative integer index\n\n"
+     "Returns:\n"
+     "    Number of digits in the nth Fibonacci number\n\n"
+     "Example:\n"
+     "    >>> fibonacci_digit_count(1000)\n"
+     "    209"},
+    {"get_num_cores", get_num_cores_raw, METH_NOARGS,
+     "get_num_cores($module, /)\n--\n\n"
+     "Get the number of available CPU cores."},
+    {"set_num_threads", FASTCALL_KW(set_num_threads_raw), METH_FASTCALL | METH_KEYWORDS,
+     "set_num_threads($module, n)\n--\n\n"
+     "Set the number of threads to use for parallel computation."},
+    {nullptr, nullptr, 0, nullptr}
+};
+
 // Module definition
 PYBIND11_MODULE(_fastfib_fd, m) {
     m.doc() = "Ultra-fast EXACT Fibonacci computation using GMP arbitrary precision and FAST DOUBLING algorithm";
     
-    // Single value function (returns string)
-    m.def("fibonacci", 
-          [](long long n) -> std::string { return fibonacci(n); },
-          py::arg("n"),
-          "Compute the nth Fibonacci number using fast doubling (GMP).\n\n"
-          "Args:\n"
-          "    n: Non-negative integer index\n\n"
-          "Returns:\n"
-          "    String representation of the exact nth Fibonacci number\n\n"
-          "Example:\n"
-          "    >>> fibonacci(10)\n"
-          "    '55'\n"
-          "    >>> fibonacci(100)\n"
-          "    '354224848179261915075'");
-    
-    // Single value function (returns Python int with arbitrary precision)
-    m.def("fibonacci_int",
-          [](long long n) -> py::object { return fibonacci_int(n); },
-          py::arg("n"),
-          "Compute the nth Fibonacci number as Python int with arbitrary precision.\n\n"
-          "Args:\n"
-          "    n: Non-negative integer index\n\n"
-          "Returns:\n"
-          "    Python int with exact value\n\n"
-          "Example:\n"
-          "    >>> fibonacci_int(100)\n"
-          "    354224848179261915075");
+    // Single value, digit count and thread-control functions (raw C API)
+    for (PyMethodDef* def = raw_methods; def->ml_name; ++def) {
+        PyObject* func = PyCFunction_NewEx(def, m.ptr(), m.attr("__name__").ptr());
+        if (!func) {
+            throw py::error_already_set();
+        }
+        m.add_object(def->ml_name, py::reinterpret_steal<py::object>(func));
+    }
     
     // Range function returning list of strings
     m.def("fibonacci_range",
@@ -310,28 +841,124 @@ PYBIND11_MODULE(_fastfib_fd, m) {
           "    >>> arr\n"
           "    array([55, 89, 144, 233, 377, 610], dtype=object)");
     
-    // Digit count function
-    m.def("fibonacci_digit_count",
-          [](long long n) -> long long { return fibonacci_digit_count(n); },
+    m.def("fibonacci_int_batch",
+          [](const std::vector<long long>& ns, int num_threads) -> py::list {
+              return fibonacci_int_batch(ns, num_threads);
+          },
+          py::arg("ns"),
+          py::arg("num_threads") = -1,
+          "Compute exact Fibonacci numbers for any list of indices as Python ints.\n\n"
+          "Unlike fibonacci_range_int the indices need not be contiguous; each\n"
+          "one is computed independently, spread over the CPU cores.\n\n"
+          "Args:\n"
+          "    ns: Sequence of non-negative integer indices\n"
+          "    num_threads: Number of CPU cores to use (-1 for all)\n\n"
+          "Returns:\n"
+          "    List of Python ints with exact values, in the order of ns\n\n"
+          "Example:\n"
+          "    >>> fibonacci_int_batch([100, 10, 1])\n"
+          "    [354224848179261915075, 55, 1]");
+    
+    m.def("fibonacci_range_digit_counts",
+          [](long long start, long long end, int num_threads) -> std::vector<long long> {
+              return fibonacci_range_digit_counts(start, end, num_threads);
+          },
+          py::arg("start"),
+          py::arg("end"),
+          py::arg("num_threads") = -1,
+          "Get the number of digits in F(start) to F(end) (inclusive).\n\n"
+          "Skips the decimal conversion done by fibonacci_range, which\n"
+          "dominates the cost for large indices.\n\n"
+          "Args:\n"
+          "    start: Starting index (non-negative)\n"
+          "    end: Ending index (non-negative, >= start)\n"
+          "    num_threads: Number of CPU cores to use (-1 for all)\n\n"
+          "Returns:\n"
+          "    List of digit counts\n\n"
+          "Example:\n"
+          "    >>> fibonacci_range_digit_counts(10, 15)\n"
+          "    [2, 2, 3, 3, 3, 3]");
+    
+    m.def("fibonacci_many",
+          [](long long n, long long count) -> py::object { return fibonacci_many(n, count); },
           py::arg("n"),
-          "Get the number of digits in F(n).\n\n"
+          py::arg("count"),
+          "Compute F(n) count times in C++ and return it once as a Python int.\n\n"
+          "Meant for benchmarking: timing one call and dividing by count gives\n"
+          "the cost of the computation without the per-call Python overhead.\n\n"
           "Args:\n"
-          "    n: Non-negative integer index\n\n"
+          "    n: Non-negative integer index\n"
+          "    count: Number of times to compute F(n) (positive)\n\n"
           "Returns:\n"
-          "    Number of digits in the nth Fibonacci number\n\n"
+          "    Python int with the exact value of F(n)\n\n"
           "Example:\n"
-          "    >>> fibonacci_digit_count(1000)\n"
-          "    209");
+          "    >>> fibonacci_many(100, 1000)\n"
+          "    354224848179261915075");
     
-    // Utility functions
-    m.def("get_num_cores",
-          []() -> int { return get_num_cores(); },
-          "Get the number of available CPU cores.");
+    // Leading / trailing digits without a full decimal conversion
+    m.def("fibonacci_prefix",
+          [](long long n, long long k) -> std::string { return fibonacci_prefix(n, k); },
+          py::call_guard<py::gil_scoped_release>(),
+          py::arg("n"),
+          py::arg("k"),
+          "Get the first k decimal digits of F(n).\n\n"
+          "Cheaper than fibonacci(n)[:k] for huge n, since the full number\n"
+          "is never converted to a decimal string.\n\n"
+          "Args:\n"
+          "    n: Non-negative integer index\n"
+          "    k: Number of leading digits (all digits if k >= digit count)\n\n"
+          "Returns:\n"
+          "    String with the leading digits of F(n)\n\n"
+          "Example:\n"
+          "    >>> fibonacci_prefix(100, 5)\n"
+          "    '35422'");
+    
+    m.def("fibonacci_suffix",
+          [](long long n, long long k) -> std::string { return fibonacci_suffix(n, k); },
+          py::call_guard<py::gil_scoped_release>(),
+          py::arg("n"),
+          py::arg("k"),
+          "Get the last k decimal digits of F(n).\n\n"
+          "Cheaper than fibonacci(n)[-k:] for huge n, since the full number\n"
+          "is never converted to a decimal string.\n\n"
+          "Args:\n"
+          "    n: Non-negative integer index\n"
+          "    k: Number of trailing digits (all digits if k >= digit count)\n\n"
+          "Returns:\n"
+          "    String with the trailing digits of F(n), zero-padded to k\n\n"
+          "Example:\n"
+          "    >>> fibonacci_suffix(100, 5)\n"
+          "    '15075'");
     
-    m.def("set_num_threads",
-          [](int n) { set_num_threads(n); },
+    m.def("fibonacci_mod",
+          [](long long n, long long m) -> long long { return fibonacci_mod(n, m); },
           py::arg("n"),
-          "Set the number of threads to use for parallel computation.");
+          py::arg("m"),
+          "Get F(n) mod m without computing F(n).\n\n"
+          "O(log n) fast doubling on residues in machine integers, so it stays\n"
+          "cheap for huge n (e.g. Pisano-period work).\n\n"
+          "Args:\n"
+          "    n: Non-negative integer index\n"
+          "    m: Positive modulus (below 2^63)\n\n"
+          "Returns:\n"
+          "    F(n) mod m as a Python int\n\n"
+          "Example:\n"
+          "    >>> fibonacci_mod(100, 1000000007)\n"
+          "    687995182");
+    
+    // Utility functions
+    m.def("bind_threads",
+          [](int num_threads) -> int { return bind_threads(num_threads); },
+          py::arg("num_threads") = -1,
+          "Pin each OpenMP worker thread to its own CPU (Linux only).\n\n"
+          "Threads are assigned round-robin over the CPUs the process may use.\n"
+          "The calling thread is part of the team and gets pinned too.\n"
+          "Setting OMP_PLACES=cores OMP_PROC_BIND=close before import gives\n"
+          "the same placement without code changes.\n\n"
+          "Args:\n"
+          "    num_threads: Number of threads to use from now on (-1 keeps current)\n\n"
+          "Returns:\n"
+          "    Number of threads pinned (0 if affinity is not supported)");
     
     // Constants
     m.attr("__version__") = "2.1.0";
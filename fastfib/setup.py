@@ -67,9 +67,12 @@ else:  # Linux and other Unix-like (including WSL)
         '-funroll-loops',
         '-fomit-frame-pointer',
         '-finline-functions',
+        '-flto',                        # Link-time optimization (as /GL on MSVC)
+        '-fno-semantic-interposition',  # Let calls between our own symbols inline
     ]
     extra_link_args = [
         '-fopenmp',
+        '-flto',
     ]
     libraries = ['gmp', 'gmpxx']
 
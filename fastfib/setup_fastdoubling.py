@@ -1,5 +1,9 @@
 from setuptools import setup, Extension
+from setuptools.command.build_ext import build_ext
 import pybind11
+import os
+import shutil
+import subprocess
 import sys
 
 # Get compiler flags
@@ -8,9 +12,11 @@ extra_compile_args = [
     '-O3',
     '-march=native',
     '-fopenmp',
+    '-flto',                        # Inline across the GMP/C++ wrapper helpers
+    '-fno-semantic-interposition',  # Let calls between our own symbols inline
 ]
 
-extra_link_args = ['-fopenmp', '-lgmp', '-lgmpxx']
+extra_link_args = ['-fopenmp', '-flto', '-lgmp', '-lgmpxx']
 
 # For macOS, might need to adjust OpenMP flags
 if sys.platform == 'darwin':
@@ -23,6 +29,54 @@ if sys.platform == 'darwin':
     ]
     extra_link_args = ['-lomp', '-lgmp', '-lgmpxx']
 
+# Workload run against the instrumented build by build_pgo
+PGO_TRAINING = """
+import _fastfib_fd as ff
+for _ in range(10000):
+    ff.fibonacci_int(1000)
+for n in (100, 10000, 100000):
+    ff.fibonacci(n)
+ff.fibonacci_range_int(1, 5000)
+ff.fibonacci_range_digit_counts(1, 100000)
+"""
+
+
+class build_pgo(build_ext):
+    """Build in place with profile-guided optimization (GCC only).
+
+    Builds an instrumented extension, runs PGO_TRAINING against it, then
+    rebuilds using the collected profile:
+
+        python setup_fastdoubling.py build_pgo
+    """
+
+    description = 'build the extension in place with profile-guided optimization'
+
+    def run(self):
+        if sys.platform in ('win32', 'darwin'):
+            raise RuntimeError('build_pgo needs GCC-style -fprofile-* flags')
+
+        profile_dir = os.path.abspath('pgo')
+        shutil.rmtree(profile_dir, ignore_errors=True)
+        self.inplace = True
+        self.force = True
+        # build_ext.run() replaces the compiler name with an instance
+        self._compiler_name = self.compiler
+
+        self._build_with([f'-fprofile-generate={profile_dir}'])
+        subprocess.check_call([sys.executable, '-c', PGO_TRAINING])
+
+        # -fprofile-correction: OpenMP threads update the counters concurrently
+        self._build_with([f'-fprofile-use={profile_dir}', '-fprofile-correction'])
+
+    def _build_with(self, flags):
+        for ext in self.extensions:
+            ext.extra_compile_args = extra_compile_args + flags
+            ext.extra_link_args = extra_link_args + flags
+        self.compiler = self._compiler_name
+        build_ext.run(self)
+
+
 ext_modules = [
     Extension(
         '_fastfib_fd',
@@ -43,6 +97,7 @@ setup(
     author='Mike',
     description='Ultra-fast Fibonacci computation using GMP and Fast Doubling',
     ext_modules=ext_modules,
+    cmdclass={'build_pgo': build_pgo},
     install_requires=['pybind11>=2.6.0', 'numpy'],
     zip_safe=False,
     python_requires='>=3.7',
@@ -6,8 +6,27 @@ Test script for fastfib package
 import sys
 import time
 
-# Allow conversion of very large integers
-sys.set_int_max_str_digits(0)  # No limit
+
+def check(label, result, expected):
+    """Print a ✓/✗ line for result == expected and return whether it held"""
+    passed = result == expected
+    print(f"  {'✓' if passed else '✗'} {label}")
+    if not passed:
+        print(f"      got {str(result)[:60]}, expected {str(expected)[:60]}")
+    return passed
+
+
+def check_raises(label, exception, func, *args):
+    """Print a ✓/✗ line for func(*args) raising exception and return whether it did"""
+    try:
+        func(*args)
+    except exception:
+        passed = True
+    else:
+        passed = False
+    print(f"  {'✓' if passed else '✗'} {label} raises {exception.__name__}")
+    return passed
+
 
 def test_fastfib():
     """Test the fastfib package"""
@@ -91,7 +110,8 @@ def test_fastfib():
         print(f"✓ fib(100) as int: {int_result}")
         
         # Verify they're the same value
-        if int(str_result) == int_result:
+        # (int -> str is the cheap direction; nothing parses decimal text)
+        if str_result == str(int_result):
             print("✓ String and int results match!")
         else:
             print("✗ String and int results don't match")
@@ -130,7 +150,7 @@ def test_fastfib():
     start = time.time()
     result = fastfib.fib_int(10000)
     elapsed = time.time() - start
-    print(f"  Single fib(10,000): {elapsed*1000:.3f} ms ({len(str(result))} digits)")
+    print(f"  Single fib(10,000): {elapsed*1000:.3f} ms ({fastfib.digit_count(10000)} digits)")
     
     # Range of values
     start = time.time()
@@ -165,9 +185,118 @@ def test_fastfib():
     print("✓ Thread control test complete")
     print()
     
+    # Test 7: F(n) mod m
+    print("Test 7: Fibonacci mod m (fib_mod)")
+    print("-" * 60)
+    m_max = 2**63 - 1
+    mod_checks = []
+    for n in [0, 1, 2, 10, 93, 94, 186, 187, 1000, 10000]:
+        for m in [1, 2, 10, 1_000_000_007, m_max]:
+            mod_checks.append(fastfib.fib_mod(n, m) == fastfib.fib_int(n) % m)
+    mod_checks = [check("fib_mod(n, m) == fib_int(n) % m for n up to 10,000, m from 1 to 2^63-1",
+                        all(mod_checks), True)]
+    # The Pisano period of 10 is 60, so F(10**18) mod 10 is F(10**18 % 60) mod 10
+    mod_checks.append(check("fib_mod(10**18, 10) (Pisano period 60)",
+                            fastfib.fib_mod(10**18, 10), fastfib.fib_int(10**18 % 60) % 10))
+    mod_checks.append(check("fib_mod(n, 1) == 0", fastfib.fib_mod(12345, 1), 0))
+    mod_checks.append(check("fib_mod is an alias of fibonacci_mod",
+                            fastfib.fib_mod is fastfib.fibonacci_mod, True))
+    mod_checks.append(check_raises("fib_mod(10, 0)", ValueError, fastfib.fib_mod, 10, 0))
+    mod_checks.append(check_raises("fib_mod(10, -7)", ValueError, fastfib.fib_mod, 10, -7))
+    mod_checks.append(check_raises("fib_mod(-1, 10)", ValueError, fastfib.fib_mod, -1, 10))
+    mod_checks.append(check_raises("fib_mod(10, 2**63)", TypeError, fastfib.fib_mod, 10, 2**63))
+    mod_passed = all(mod_checks)
+    print("✓ fib_mod tests passed!" if mod_passed else "✗ Some fib_mod tests failed")
+    print()
+    
+    # Test 8: Leading / trailing digits
+    print("Test 8: Leading and trailing digits (fib_prefix / fib_suffix)")
+    print("-" * 60)
+    affix_checks = []
+    for n in [0, 1, 15, 100, 1000, 10000]:
+        digits = str(fastfib.fib_int(n))
+        # Trailing digits that start with a zero must keep it (F(15) = 610)
+        zero_k = next((k for k in range(1, len(digits)) if digits[-k] == "0"), None)
+        ks = {0, 1, 5, len(digits) - 1, len(digits), len(digits) + 10}
+        if zero_k is not None:
+            ks.add(zero_k)
+        for k in sorted(ks):
+            affix_checks.append(fastfib.fib_prefix(n, k) == digits[:k])
+            affix_checks.append(fastfib.fib_suffix(n, k) == (digits[-k:] if k else ""))
+    affix_checks = [check("fib_prefix / fib_suffix match str(fib_int(n))[:k] / [-k:] "
+                          "(k=0, k >= digit count, zero-led tails)", all(affix_checks), True)]
+    affix_checks.append(check("fib_suffix(15, 1) keeps the zero", fastfib.fib_suffix(15, 1), "0"))
+    affix_checks.append(check("fib_prefix(0, 3)", fastfib.fib_prefix(0, 3), "0"))
+    affix_checks.append(check_raises("fib_prefix(-1, 3)", ValueError, fastfib.fib_prefix, -1, 3))
+    affix_checks.append(check_raises("fib_suffix(10, -1)", ValueError, fastfib.fib_suffix, 10, -1))
+    affix_passed = all(affix_checks)
+    print("✓ fib_prefix / fib_suffix tests passed!" if affix_passed
+          else "✗ Some fib_prefix / fib_suffix tests failed")
+    print()
+    
+    # Test 9: Batch of arbitrary indices
+    print("Test 9: Batch of arbitrary indices (fib_int_batch)")
+    print("-" * 60)
+    batches = [
+        ("unsorted", [100, 10, 1, 5000, 0, 93]),
+        ("duplicates", [50, 50, 1000, 50, 1000]),
+        ("empty", []),
+        # n <= 186 runs on 128-bit integers, larger n on GMP
+        ("u128 and GMP paths", [185, 186, 187, 188, 2, 10000, 186]),
+    ]
+    batch_checks = [check(f"fib_int_batch, {label}", fastfib.fib_int_batch(ns),
+                          [fastfib.fib_int(n) for n in ns])
+                    for label, ns in batches]
+    batch_checks.append(check_raises("fib_int_batch([3, -1])", ValueError,
+                                     fastfib.fib_int_batch, [3, -1]))
+    batch_passed = all(batch_checks)
+    print("✓ fib_int_batch tests passed!" if batch_passed else "✗ Some fib_int_batch tests failed")
+    print()
+    
+    # Test 10: Digit counts over a range
+    print("Test 10: Digit counts over a range (fib_range_digit_counts)")
+    print("-" * 60)
+    # 0-200 crosses the exact 64-bit count (n <= 93) into the closed form.
+    # The others are the n up to 200,000 where n*log10(phi) - log10(sqrt5)
+    # is nearest an integer, i.e. F(n) is nearest a power of ten and the
+    # closed form is closest to falling back to the exact count. fib(i)
+    # is the exact decimal string (str() of a 20,000-digit int hits
+    # Python's int-to-str limit).
+    ranges = [(0, 200), (2952, 2956), (8938, 8942), (66951, 66955), (136936, 136940)]
+    count_checks = [check(f"fib_range_digit_counts({a}, {b})", fastfib.fib_range_digit_counts(a, b),
+                          [len(fastfib.fib(i)) for i in range(a, b + 1)])
+                    for a, b in ranges]
+    count_checks.append(check_raises("fib_range_digit_counts(-1, 5)", ValueError,
+                                     fastfib.fib_range_digit_counts, -1, 5))
+    count_checks.append(check_raises("fib_range_digit_counts(5, 4)", ValueError,
+                                     fastfib.fib_range_digit_counts, 5, 4))
+    count_passed = all(count_checks)
+    print("✓ fib_range_digit_counts tests passed!" if count_passed
+          else "✗ Some fib_range_digit_counts tests failed")
+    print()
+    
+    # Test 11: Benchmark loop
+    print("Test 11: Repeated computation in C++ (fib_many)")
+    print("-" * 60)
+    # The benchmark's C++ column times this loop, so it must return F(n) itself
+    many_checks = [check(f"fib_many({n}, {count}) == fib_int({n})", fastfib.fib_many(n, count),
+                         fastfib.fib_int(n))
+                   for n, count in [(0, 1), (1, 3), (186, 100), (187, 100), (10000, 5)]]
+    many_checks.append(check_raises("fib_many(10, 0)", ValueError, fastfib.fib_many, 10, 0))
+    many_checks.append(check_raises("fib_many(10, -5)", ValueError, fastfib.fib_many, 10, -5))
+    many_checks.append(check_raises("fib_many(-1, 10)", ValueError, fastfib.fib_many, -1, 10))
+    many_passed = all(many_checks)
+    print("✓ fib_many tests passed!" if many_passed else "✗ Some fib_many tests failed")
+    print()
+    
     # Summary
+    all_ok = (all_passed and range_passed and mod_passed and affix_passed
+              and batch_passed and count_passed and many_passed)
     print("=" * 60)
-    print("✓ All tests completed successfully!")
+    if all_ok:
+        print("✓ All tests completed successfully!")
+    else:
+        print("✗ Some tests failed")
     print("=" * 60)
     print()
     print("Quick usage examples (EXACT arbitrary precision):")
@@ -182,8 +311,8 @@ def test_fastfib():
     print("  >>> fastfib.fib_int(1000)    # EXACT 209-digit number!")
     print("  43466...93750")
     print()
+    return all_ok
 
 if __name__ == "__main__":
-    test_fastfib()
-    sys.exit(0)
+    sys.exit(0 if test_fastfib() else 1)
 
@@ -5,6 +5,7 @@ for both Fibonacci numbers and the staircase problem.
 """
 
 import csv
+import io
 
 def generate_calc_data(max_n=20):
     """Generate data for the spreadsheet."""
@@ -52,24 +53,24 @@ def generate_calc_data(max_n=20):
     phi = (1 + sqrt5) / 2
     psi = (1 - sqrt5) / 2
     
+    # Exact values come from the additive recurrence (fib, next_fib) =
+    # (F(n), F(n+1)); only the φ^n / ψ^n display columns need a power
     prev_fib = 0
+    fib, next_fib = 0, 1
     for n in range(0, max_n + 1):
         if n == 0:
-            fib = 0
             ways = ''  # No staircase for 0 stairs
             ratio = ''
         elif n == 1:
-            fib = 1
             ways = 1
             ratio = ''
         else:
-            fib = round((phi**n - psi**n) / sqrt5)
-            ways = round((phi**(n+1) - psi**(n+1)) / sqrt5)
-            ratio = f"{fib / prev_fib:.6f}" if prev_fib != 0 else ''
+            ways = next_fib
+            ratio = f"{fib / prev_fib:.6f}"
         
         data.append([
             n,
-            ways if ways != '' else '',
+            ways,
             f"F({n+1})" if n > 0 else '',
             fib,
             ratio,
@@ -77,6 +78,7 @@ def generate_calc_data(max_n=20):
             f"{psi**n:.6f}"
         ])
         prev_fib = fib if fib != 0 else prev_fib
+        fib, next_fib = next_fib, fib + next_fib
     
     return data
 
@@ -84,11 +86,13 @@ def main():
     print("Generating LibreOffice Calc spreadsheet data...")
     data = generate_calc_data(30)
     
-    # Write to CSV
+    # Write to CSV: format in memory, then hand the file a single write.
+    # csv still does the formatting because the formula cells need quoting.
     csv_file = 'fibonacci_staircase.csv'
+    buf = io.StringIO(newline='')
+    csv.writer(buf).writerows(data)
     with open(csv_file, 'w', newline='') as f:
-        writer = csv.writer(f)
-        writer.writerows(data)
+        f.write(buf.getvalue())
     
     print(f"✓ Created {csv_file}")
     print("\nTo use in LibreOffice Calc:")
@@ -3,6 +3,7 @@
 Benchmark comparison between matrix exponentiation and fast doubling implementations
 """
 
+import gc
 import timeit
 import sys
 
@@ -38,19 +39,36 @@ if not (matrix_available or fd_available):
     print("  python setup_fastdoubling.py build_ext --inplace  # for fast doubling")
     sys.exit(1)
 
-def benchmark(func, *args, number=1):
-    """Benchmark a function call"""
-    return timeit.timeit(lambda: func(*args), number=number)
+def benchmark(ff, stmt):
+    """Benchmark a statement against one implementation.
+
+    Args:
+        ff: Extension module, bound to the name ``ff`` inside stmt
+        stmt: Statement to time, e.g. "ff.fibonacci_int(100)"
+
+    Returns:
+        Seconds per execution
+    """
+    # A string statement avoids timing a lambda frame on every call, and
+    # autorange picks the loop count so fast rows aren't lost in timer noise
+    timer = timeit.Timer(stmt, globals={'ff': ff})
+    gc.disable()
+    try:
+        number, elapsed = timer.autorange()
+    finally:
+        gc.enable()
+    return elapsed / number
 
 # Test cases
 test_cases = [
-    ("Small value", lambda ff: ff.fibonacci_int(100), 10000),
-    ("Medium value", lambda ff: ff.fibonacci_int(1000), 1000),
-    ("Large value", lambda ff: ff.fibonacci_int(10000), 100),
-    ("Very large value (string)", lambda ff: ff.fibonacci(100000), 10),  # Use string to avoid conversion limit
-    ("Small range", lambda ff: ff.fibonacci_range_int(1, 100), 1000),
-    ("Medium range", lambda ff: ff.fibonacci_range_int(1, 1000), 100),
-    ("Large range", lambda ff: ff.fibonacci_range_int(1, 5000), 10),
+    ("Small value", "ff.fibonacci_int(100)"),
+    ("Medium value", "ff.fibonacci_int(1000)"),
+    ("Large value", "ff.fibonacci_int(10000)"),
+    ("Very large value (string)", "ff.fibonacci(100000)"),  # Use string to avoid conversion limit
+    ("Small range", "ff.fibonacci_range_int(1, 100)"),
+    ("Medium range", "ff.fibonacci_range_int(1, 1000)"),
+    ("Large range", "ff.fibonacci_range_int(1, 5000)"),
+    ("Offset range (string)", "ff.fibonacci_range(50000, 51000)"),  # Seeded once, then additions
 ]
 
 print("=" * 60)
@@ -58,16 +76,16 @@ print("Benchmark Results")
 print("=" * 60)
 print()
 
-for name, func, iterations in test_cases:
+for name, stmt in test_cases:
     print(f"{name}:")
     
     if matrix_available:
-        t_matrix = benchmark(func, ff_matrix, number=iterations) * 1000 / iterations
-        print(f"  Matrix:        {t_matrix:8.3f} ms")
+        t_matrix = benchmark(ff_matrix, stmt) * 1e6
+        print(f"  Matrix:        {t_matrix:10.3f} µs")
     
     if fd_available:
-        t_fd = benchmark(func, ff_fd, number=iterations) * 1000 / iterations
-        print(f"  Fast Doubling: {t_fd:8.3f} ms")
+        t_fd = benchmark(ff_fd, stmt) * 1e6
+        print(f"  Fast Doubling: {t_fd:10.3f} µs")
     
     if matrix_available and fd_available:
         speedup = t_matrix / t_fd
@@ -84,17 +102,18 @@ print("Correctness Verification")
 print("=" * 60)
 print()
 
-test_values = [0, 1, 2, 10, 100, 1000]
+test_values = sorted({0, 1, 2, 10, 100, 1000})
 all_correct = True
 
+# Fetch every test value with one range call per implementation
+ranges = {}
+if matrix_available:
+    ranges['matrix'] = ff_matrix.fibonacci_range(0, test_values[-1])
+if fd_available:
+    ranges['fd'] = ff_fd.fibonacci_range(0, test_values[-1])
+
 for n in test_values:
-    results = {}
-    
-    if matrix_available:
-        results['matrix'] = ff_matrix.fibonacci(n)
-    
-    if fd_available:
-        results['fd'] = ff_fd.fibonacci(n)
+    results = {impl: values[n] for impl, values in ranges.items()}
     
     # Check if all implementations give the same result
     if len(set(results.values())) == 1:
@@ -105,6 +124,22 @@ for n in test_values:
             print(f"  {impl}: {val[:50]}")
         all_correct = False
 
+# Ranges are walked by addition from a fast-doubling seed, so check them
+# against independently computed single values
+test_ranges = [(0, 20), (95, 105), (4990, 5010)]
+
+for start, end in test_ranges:
+    for impl, ff in (('matrix', ff_matrix if matrix_available else None),
+                     ('fd', ff_fd if fd_available else None)):
+        if ff is None:
+            continue
+        expected = [ff.fibonacci(n) for n in range(start, end + 1)]
+        if ff.fibonacci_range(start, end) == expected:
+            print(f"{impl} range F({start})..F({end}) ✓")
+        else:
+            print(f"{impl} range F({start})..F({end}) MISMATCH!")
+            all_correct = False
+
 print()
 if all_correct:
     print("✓ All implementations produce identical results!")
@@ -4,11 +4,16 @@ Performance comparison: GMP Exact vs Python Binet vs Iterative
 Tests the NEW GMP-based fastfib library with arbitrary precision
 """
 
+import time
 import timeit
 import argparse
+import functools
+import math
+from concurrent.futures import ProcessPoolExecutor
 import sys
 import os
-from mpmath import mp, sqrt, power, nint
+from mpmath.libmp import (fone, from_int, ifib, mpf_add, mpf_div, mpf_pow_int,
+                          mpf_shift, mpf_sqrt, round_nearest, to_int)
 
 # Import gmpy2 for Python GMP bindings
 try:
@@ -26,26 +31,55 @@ except ImportError as e:
     FASTFIB_AVAILABLE = False
     print(f"Warning: fastfib (C++ GMP) not available: {e}")
 
+# Builds with fibonacci_many can run the timing loop inside C++
+FASTFIB_BATCH = FASTFIB_AVAILABLE and hasattr(fastfib, "fibonacci_many")
+
 # Allow printing very large integers
 sys.set_int_max_str_digits(0)  # No limit
 
 
-def fibonacci_gmpy2(n):
+def _small_fibonacci_table(max_n):
     """
-    Calculate the nth Fibonacci number using gmpy2 (Python GMP bindings) with Fast Doubling.
+    Build the tuple (F(0), F(1), ..., F(max_n)) by plain addition.
     
-    TIME COMPLEXITY: O(log n) - Same as C++ but with Python overhead
+    Args:
+        max_n (int): The last index in the table (max_n >= 1)
+    
+    Returns:
+        tuple: The Fibonacci numbers up to F(max_n)
+    """
+    table = [0, 1]
+    while len(table) <= max_n:
+        table.append(table[-1] + table[-2])
+    return tuple(table)
+
+
+# F(92) is the largest Fibonacci number that fits in a signed 64-bit int;
+# up to there the Python implementations answer from a table, not a loop
+INT64_MAX_N = 92
+_FIB_SMALL = _small_fibonacci_table(INT64_MAX_N)
+
+
+def fibonacci_gmpy2(n, return_type="int"):
+    """
+    Calculate the nth Fibonacci number with GMP's own routine through gmpy2.
+    
+    TIME COMPLEXITY: O(log n) - mpz_fib_ui doubles through the bits of n
     
     This implementation uses:
     - gmpy2 library (Python bindings to GMP)
-    - Fast doubling algorithm (same as C++ version)
-    - Pure Python implementation (no C++ compilation needed)
+    - gmpy2.fib, i.e. GMP's mpz_fib_ui: the same doubling recurrences
+      as the C++ version, with GMP's tuned squaring code
+    - No Python-level loop at all (no C++ compilation needed)
     
     Args:
         n (int): The position in the Fibonacci sequence (n >= 0)
+        return_type (str): "int" for a Python int, or "mpz" to get the
+            gmpy2.mpz and skip the conversion (for callers that compare
+            the value or keep computing with gmpy2)
     
     Returns:
-        int: The exact nth Fibonacci number
+        int or gmpy2.mpz: The exact nth Fibonacci number
     """
     if not GMPY2_AVAILABLE:
         raise ImportError("gmpy2 not available. Install with: pip install gmpy2")
@@ -53,38 +87,76 @@ def fibonacci_gmpy2(n):
     if n < 0:
         raise ValueError("n must be non-negative")
     
-    if n == 0:
-        return 0
-    if n == 1:
-        return 1
+    # mpz_fib_ui has its own small-n table
+    if return_type == "mpz":
+        return gmpy2.fib(n)
     
-    # Fast doubling iterative implementation using gmpy2
-    # Process bits of n from left to right
+    if n <= INT64_MAX_N:
+        return _FIB_SMALL[n]
+    
+    return int(gmpy2.fib(n))
+
+
+def fibonacci_gmpy2_loop(n, return_type="int"):
+    """
+    Calculate the nth Fibonacci number with a Python fast-doubling loop over gmpy2 mpz values.
+    
+    TIME COMPLEXITY: O(log n) - Same as C++ but with Python overhead
+    
+    Reference version of fibonacci_gmpy2 (select it with
+    --pure-python-gmpy2): the same algorithm as the C++ library, with
+    GMP doing the arithmetic and the Python interpreter driving the loop.
+    
+    Args:
+        n (int): The position in the Fibonacci sequence (n >= 0)
+        return_type (str): "int" for a Python int, or "mpz" to get the
+            gmpy2.mpz and skip the conversion
+    
+    Returns:
+        int or gmpy2.mpz: The exact nth Fibonacci number
+    """
+    if not GMPY2_AVAILABLE:
+        raise ImportError("gmpy2 not available. Install with: pip install gmpy2")
     
-    # Find bit length
-    bit_length = n.bit_length()
+    if n < 0:
+        raise ValueError("n must be non-negative")
     
-    # Start with F(0) = 0, F(1) = 1
-    fk = gmpy2.mpz(0)
+    if n <= INT64_MAX_N:
+        return gmpy2.mpz(_FIB_SMALL[n]) if return_type == "mpz" else _FIB_SMALL[n]
+    
+    # Fast doubling iterative implementation using gmpy2
+    # Process bits of n from left to right; the top bit takes (F(0), F(1))
+    # to (F(1), F(2)), so start there and walk the rest of bin(n)
+    fk = gmpy2.mpz(1)
     fk1 = gmpy2.mpz(1)
     
-    for i in range(bit_length - 1, -1, -1):
-        # F(2k) = F(k) * [2*F(k+1) - F(k)]
-        f2k = fk * (2 * fk1 - fk)
+    for bit in bin(n)[3:]:
+        # F(2k) = F(k) * [2*F(k+1) - F(k)], doubling with a shift (mpz_mul_2exp)
+        f2k = fk * ((fk1 << 1) - fk)
         
         # F(2k+1) = F(k+1)^2 + F(k)^2
         f2k1 = fk1 * fk1 + fk * fk
         
-        if (n >> i) & 1:
-            # Bit is 1, so we want F(2k+1) and F(2k+2)
-            fk = f2k1
-            fk1 = f2k + f2k1
+        # Rebind rather than copy: bit 1 -> (F(2k+1), F(2k+2)), bit 0 -> (F(2k), F(2k+1))
+        if bit == "1":
+            fk, fk1 = f2k1, f2k + f2k1
         else:
-            # Bit is 0, so we want F(2k) and F(2k+1)
-            fk = f2k
-            fk1 = f2k1
+            fk, fk1 = f2k, f2k1
     
-    return int(fk)
+    return fk if return_type == "mpz" else int(fk)
+
+
+# F(70) is the last value Binet's formula gets right in double precision
+BINET_FLOAT_MAX_N = 70
+_FLOAT_PHI = (1 + 5 ** 0.5) / 2
+_FLOAT_SQRT5 = 5 ** 0.5
+
+# log2(phi): F(n) has about n * LOG2_PHI bits
+LOG2_PHI = 0.6942419136306174
+
+# (sqrt5, phi) per precision, so repeated calls at the same precision
+# skip the square root and constant construction
+_BINET_CONST_CACHE = {}
 
 
 def fibonacci_binet_mpmath(n):
@@ -93,6 +165,11 @@ def fibonacci_binet_mpmath(n):
     
     TIME COMPLEXITY: ~O(log n) for arbitrary precision
     
+    n <= BINET_FLOAT_MAX_N needs no more than a double, so it is evaluated
+    with native floats. Larger n are evaluated with mpmath at ~0.69n bits
+    of working precision, so this column keeps timing the closed form
+    itself at every n (the exact integer route is fibonacci_iterative).
+    
     Args:
         n (int): The position in the Fibonacci sequence (n >= 0)
     
@@ -102,34 +179,72 @@ def fibonacci_binet_mpmath(n):
     if n < 0:
         raise ValueError("n must be non-negative")
     
-    if n == 0:
-        return 0
+    if n <= BINET_FLOAT_MAX_N:
+        return round(_FLOAT_PHI ** n / _FLOAT_SQRT5)
+    
+    # Working precision in bits: the size of F(n), plus log2(n) bits for
+    # the rounding error the ~2 log2(n) multiplications of phi^n collect,
+    # plus a guard (exact for every n up to 6000 with a guard of 4; with
+    # 16 it is exact through n = 1,000,000).
+    # The arithmetic runs on mpmath's raw mpf tuples with an explicit
+    # precision, so the global mp context is never switched and restored.
+    prec = int(n * LOG2_PHI) + n.bit_length() + 16
+    
+    cached = _BINET_CONST_CACHE.get(prec)
+    if cached is None:
+        sqrt5 = mpf_sqrt(from_int(5), prec)
+        cached = (sqrt5, mpf_shift(mpf_add(fone, sqrt5, prec), -1))
+        _BINET_CONST_CACHE[prec] = cached
+    sqrt5, phi = cached
+    
+    # |psi^n / sqrt5| < 0.5 for every n >= 0, so rounding phi^n / sqrt5
+    # alone gives F(n) without the psi term; mpf_pow_int is mpmath's
+    # integer-exponent square-and-multiply
+    result = mpf_div(mpf_pow_int(phi, n, prec), sqrt5, prec)
+    
+    # int() because the gmpy backend returns an mpz
+    return int(to_int(result, round_nearest))
+
+
+def fibonacci_mpmath_fib(n):
+    """
+    Calculate the nth Fibonacci number with mpmath's exact integer routine.
     
-    # Dynamically set precision based on expected result size
-    digits_needed = int(n / 4) + 50
-    old_dps = mp.dps
-    mp.dps = max(50, min(digits_needed, 30000))
+    TIME COMPLEXITY: O(log n) - Logarithmic doubling over mpz/int values
     
-    try:
-        sqrt5 = sqrt(5)
-        phi = (1 + sqrt5) / 2
-        
-        if n > 20:
-            result = power(phi, n) / sqrt5
-        else:
-            psi = (1 - sqrt5) / 2
-            result = (power(phi, n) - power(psi, n)) / sqrt5
-        
-        return int(nint(result))
-    finally:
-        mp.dps = old_dps
+    mpmath.fib(n) rounds to the working precision (int(mpmath.fib(80)) is
+    already wrong at the default 53 bits), so this calls the exact helper
+    behind it, mpmath.libmp.ifib, directly. It is the library counterpart
+    of fibonacci_binet_mpmath, which stays on the closed form.
+    
+    Args:
+        n (int): The position in the Fibonacci sequence (n >= 0)
+    
+    Returns:
+        int: The nth Fibonacci number
+    """
+    if n < 0:
+        raise ValueError("n must be non-negative")
+    
+    # int() because the gmpy backend returns an mpz
+    return int(ifib(n))
 
 
 def fibonacci_iterative(n):
     """
-    Calculate the nth Fibonacci number using iterative approach.
+    Calculate the nth Fibonacci number iteratively with fast doubling.
     
-    TIME COMPLEXITY: O(n) - Linear Time
+    TIME COMPLEXITY: O(log n) - One doubling step per bit of n
+    
+    Walks the bits of n from the most significant down, keeping
+    (F(k), L(k)) where L is the Lucas sequence, the same scheme as the
+    C++ library. Each bit costs two big multiplications and a handful of
+    Python operations, instead of three and nearly twice as many with
+    (F(k), F(k+1)):
+        F(2k)   = F(k) * L(k)          L(2k)   = L(k)^2 - 2*(-1)^k
+        F(2k+1) = (F(2k) + L(2k)) / 2  L(2k+1) = (5*F(2k) + L(2k)) / 2
+    
+    n <= 92 (F(n) fits in int64) is looked up in a precomputed table.
     
     Args:
         n (int): The position in the Fibonacci sequence (n >= 0)
@@ -140,29 +255,36 @@ def fibonacci_iterative(n):
     if n < 0:
         raise ValueError("n must be non-negative")
     
-    if n <= 1:
-        return n
-    
-    prev2 = 0
-    prev1 = 1
-    
-    for i in range(2, n + 1):
-        current = prev1 + prev2
-        prev2 = prev1
-        prev1 = current
+    if n <= INT64_MAX_N:
+        return _FIB_SMALL[n]
+    
+    # The top bit gives k = 1: F(1) = L(1) = 1. The remaining bits come
+    # from one bin() string instead of a shift of n per bit
+    fk, lk = 1, 1
+    k_odd = True
+    for bit in bin(n)[3:]:
+        fk *= lk
+        lk = lk * lk + 2 if k_odd else lk * lk - 2
+        if bit == "1":
+            # Both sums are even, so the shifts are exact
+            fk, lk = (fk + lk) >> 1, (5 * fk + lk) >> 1
+            k_odd = True
+        else:
+            k_odd = False
     
-    return prev1
+    return fk
 
 
 def fibonacci_gmp(n):
     """
-    Calculate the nth Fibonacci number using GMP matrix exponentiation.
+    Calculate the nth Fibonacci number using the C++ GMP library (fastfib).
     
     TIME COMPLEXITY: O(log n) - Logarithmic multiplications (but each gets slower as numbers grow)
     
     Returns EXACT arbitrary precision integer using:
     - GMP (GNU Multiple Precision) library
-    - Matrix exponentiation method
+    - Fast doubling over (F(k), L(k)), with L the Lucas sequence
+    - Native 128-bit integers while F(n) fits (n <= 186)
     - Multi-core parallel processing (for batch operations)
     
     Args:
@@ -178,260 +300,565 @@ def fibonacci_gmp(n):
     return fastfib.fibonacci_int(n)
 
 
-def time_function(func, n, iterations=1000):
+# Memoized wrapper: after the first call this is a dictionary lookup, so
+# timing it gives the floor of a Python-level call with no work behind it
+fibonacci_gmp_cached = functools.lru_cache(maxsize=None)(fibonacci_gmp)
+
+# Implementations replaced by memoize_algorithms (--cache)
+MEMOIZED_ALGORITHMS = (
+    "fibonacci_gmpy2",
+    "fibonacci_gmpy2_loop",
+    "fibonacci_binet_mpmath",
+    "fibonacci_mpmath_fib",
+    "fibonacci_iterative",
+    "fibonacci_gmp",
+)
+
+
+def memoize_algorithms():
+    """
+    Replace the Fibonacci implementations with memoized versions.
+    
+    For using this script as a correctness oracle: each F(n) is computed
+    once and repeated queries are dictionary lookups. Timings taken
+    afterwards measure the cache, not the algorithms; the C++ column's
+    batched loop inside fastfib is the one exception.
+    """
+    namespace = globals()
+    for name in MEMOIZED_ALGORITHMS:
+        namespace[name] = functools.lru_cache(maxsize=None)(namespace[name])
+
+
+def time_function(func, n, iterations=None, call_kwargs=None):
     """
     Time how long it takes to compute func(n).
     
     Args:
         func: The function to time
         n: The Fibonacci number to compute
-        iterations: Number of times to repeat
+        iterations: Number of times to repeat (None sizes the run with
+            timeit's autorange, to at least 0.2 seconds)
+        call_kwargs (dict): Keyword arguments for each call, e.g.
+            {"return_type": "mpz"}
     
     Returns:
         Average time per call in microseconds
     """
-    total_time = timeit.timeit(lambda: func(n), number=iterations)
+    # A compiled "f(n)" statement avoids a lambda frame and closure read
+    # per call, which is a large share of a sub-microsecond C++ call.
+    # Keyword arguments are spelled out in the statement too, since a
+    # **kwargs call or a functools.partial costs several times more.
+    call_kwargs = call_kwargs or {}
+    args = ", ".join(["n"] + [f"{name}={name}" for name in call_kwargs])
+    timer = timeit.Timer(f"f({args})", globals={"f": func, "n": n, **call_kwargs})
+    if iterations is None:
+        iterations, total_time = timer.autorange()
+    else:
+        total_time = timer.timeit(number=iterations)
     avg_time_microseconds = (total_time / iterations) * 1_000_000
     return avg_time_microseconds
 
 
-def run_comparison_test():
+# Target measurement time per algorithm in single-n mode
+PROBE_TARGET_SECONDS = 0.5
+
+
+def call_and_size(func, n, call_kwargs=None):
     """
-    Compare C++ GMP vs Python gmpy2 vs Python Binet vs Iterative.
+    Compute func(n) once and size a timing run from how long it took.
+    
+    Lets the verification call double as the probe for the iteration count,
+    so slow algorithms at large n aren't repeated thousands of times.
+    
+    Args:
+        func: The function to call
+        n: The Fibonacci number to compute
+        call_kwargs (dict): Keyword arguments for the call, as for time_function
+    
+    Returns:
+        (result, iterations): func(n) and an iteration count that should take
+        about PROBE_TARGET_SECONDS
     """
-    print("=" * 160)
-    print("FIBONACCI ALGORITHMS COMPARISON")
-    print("=" * 160)
-    print()
-    print("Comparing four approaches:")
-    print("  1. C++ GMP (fastfib)      - Fast Doubling, EXACT arbitrary precision, compiled C++ with GMP")
-    print("  2. Python gmpy2           - Fast Doubling, EXACT arbitrary precision, Python with GMP bindings")
-    print("  3. Python Binet (mpmath)  - Binet's formula, arbitrary precision, pure Python with mpmath")
-    print("  4. Python Iterative       - Simple loop, EXACT, O(n) linear time")
-    print()
-    print("The 'Ratio' column shows how each algorithm scales as n increases (relative to n=10 baseline)")
-    print()
-    print("-" * 160)
-    
-    # Test cases
-    test_cases = [
-        ("Tiny", 10, 50000),
-        ("Small", 50, 50000),
-        ("Medium", 100, 50000),
-        ("Large", 500, 10000),
-        ("Very Large", 1_000, 5000),
-        ("Huge", 5_000, 1000),
-        ("Massive", 10_000, 500),
-        ("Extreme", 50_000, 100),
-        ("Ultra", 100_000, 50),
-    ]
+    start = time.perf_counter()
+    result = func(n, **(call_kwargs or {}))
+    elapsed = time.perf_counter() - start
+    iterations = max(1, min(1_000_000, int(PROBE_TARGET_SECONDS / max(elapsed, 1e-9))))
+    return result, iterations
+
+
+# Computations per fibonacci_many call when autoranging the C++ column
+CPP_BATCH_COUNT = 1000
+
+
+def time_fibonacci_cpp(n, iterations=None):
+    """
+    Time how long the C++ library takes to compute F(n).
     
-    # Print header
-    if FASTFIB_AVAILABLE and GMPY2_AVAILABLE:
-        print(f"{'Category':<12} {'n':>10} | {'C++ GMP':>13} {'Ratio':>7} | {'Py gmpy2':>11} {'Ratio':>7} | {'Py Binet':>11} {'Ratio':>7} | {'Py Iter':>12} {'Ratio':>7} | {'C++ vs':>8} | {'C++ vs':>8}")
-        print(f"{'':12} {'':>10} | {'(fastfib) μs':>13} {'':>7} | {'(GMP) μs':>11} {'':>7} | {'(mpmath) μs':>11} {'':>7} | {'(loop) μs':>12} {'':>7} | {'gmpy2':>8} | {'Binet':>8}")
-    elif FASTFIB_AVAILABLE:
-        print(f"{'Category':<12} {'n':>10} | {'C++ GMP':>10} {'Ratio':>7} | {'Py Binet':>11} {'Ratio':>7} | {'Py Iter':>12} {'Ratio':>7} | {'C++ vs Binet':>13} {'C++ vs Iter':>12}")
-        print(f"{'':12} {'':>10} | {'(fastfib) μs':>10} {'':>7} | {'(mpmath) μs':>11} {'':>7} | {'(loop) μs':>12} {'':>7} | {'':>13} {'':>12}")
+    With fastfib.fibonacci_many the whole loop runs in one C++ call, so the
+    result is the cost of the computation rather than of the Python to C++
+    call around it. Older builds fall back to a plain loop over
+    fastfib.fibonacci_int (skipping the fibonacci_gmp wrapper frame).
+    Both are timed with perf_counter_ns, which has the finest resolution.
+    
+    Args:
+        n: The Fibonacci number to compute
+        iterations: Number of times to repeat (None sizes the run with
+            timeit's autorange, calling fibonacci_many with CPP_BATCH_COUNT)
+    
+    Returns:
+        Average time per computation in microseconds
+    """
+    if iterations is None:
+        if not FASTFIB_BATCH:
+            return time_function(fastfib.fibonacci_int, n)
+        timer = timeit.Timer("f(n, count)", globals={"f": fastfib.fibonacci_many,
+                                                     "n": n, "count": CPP_BATCH_COUNT})
+        calls, total_time = timer.autorange()
+        return total_time / (calls * CPP_BATCH_COUNT) * 1_000_000
+    
+    if FASTFIB_BATCH:
+        start = time.perf_counter_ns()
+        fastfib.fibonacci_many(n, iterations)
+        elapsed_ns = time.perf_counter_ns() - start
     else:
-        print(f"{'Category':<12} {'n':>10} | {'Py Binet':>12} {'Ratio':>8} | {'Py Iterative':>14} {'Ratio':>8} | {'Speedup':>10}")
-        print(f"{'':12} {'':>10} | {'(mpmath) μs':>12} {'':>8} | {'(loop) μs':>14} {'':>8} | {'':>10}")
-    print("-" * 160)
-    
-    gmp_results = []
-    gmpy2_results = []
-    binet_results = []
-    iterative_results = []
-    gmp_baseline = None
-    gmpy2_baseline = None
-    binet_baseline = None
-    iter_baseline = None
-    
-    for category, n, iterations in test_cases:
-        # Time C++ GMP fast doubling (O(log n) multiplications, EXACT)
-        if FASTFIB_AVAILABLE:
+        f = fastfib.fibonacci_int
+        start = time.perf_counter_ns()
+        for _ in range(iterations):
+            f(n)
+        elapsed_ns = time.perf_counter_ns() - start
+    
+    return elapsed_ns / iterations / 1000
+
+
+# Rows of the comparison table. Every timing sizes itself with timeit's
+# autorange, so no per-row iteration counts are needed.
+TEST_PLAN = (
+    ("Tiny",            10),
+    ("Small",           50),
+    ("Medium",         100),
+    ("Large",          500),
+    ("Very Large",   1_000),
+    ("Huge",         5_000),
+    ("Massive",     10_000),
+    ("Extreme",     50_000),
+    ("Ultra",      100_000),
+)
+
+
+def run_timing_jobs(jobs, parallel=False):
+    """
+    Run timing jobs one after another, or spread over worker processes.
+    
+    Processes rather than threads, since mpmath and Python big integers
+    hold the GIL (and gmpy2 only drops it with allow_release_gil, which
+    costs a lock round trip per operation). In parallel there is one
+    worker per core and the largest n go first, so the Ultra and Extreme
+    jobs do not end up queued behind each other on a single worker.
+    
+    Args:
+        jobs (dict): Maps (column, n) to (timer, *args); timer(*args)
+            returns a time in microseconds
+        parallel (bool): Run the jobs on one worker process per core
+    
+    Returns:
+        dict: Maps (column, n) to the time, or to the exception it raised
+    """
+    results = {}
+    if not parallel:
+        for key, (timer, *args) in jobs.items():
             try:
-                gmp_time = time_function(fibonacci_gmp, n, iterations=min(iterations, 1000))
-                gmp_results.append((n, gmp_time))
-                if gmp_baseline is None:
-                    gmp_baseline = gmp_time
-                gmp_ratio = gmp_time / gmp_baseline
+                results[key] = timer(*args)
             except Exception as e:
-                print(f"{category:<12} {n:>10,} | C++ GMP ERROR: {e}")
-                continue
-        
-        # Time Python gmpy2 fast doubling (O(log n), Python + GMP)
-        if GMPY2_AVAILABLE:
+                results[key] = e
+        return results
+    
+    workers = min(len(jobs), os.cpu_count() or 1)
+    largest_first = sorted(jobs.items(), key=lambda job: job[0][1], reverse=True)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {key: pool.submit(timer, *args) for key, (timer, *args) in largest_first}
+        for key, future in futures.items():
             try:
-                gmpy2_iters = min(iterations, 5000) if n < 10000 else min(iterations, 1000)
-                gmpy2_time = time_function(fibonacci_gmpy2, n, iterations=gmpy2_iters)
-                gmpy2_results.append((n, gmpy2_time))
-                if gmpy2_baseline is None:
-                    gmpy2_baseline = gmpy2_time
-                gmpy2_ratio = gmpy2_time / gmpy2_baseline
+                results[key] = future.result()
             except Exception as e:
-                print(f"{category:<12} {n:>10,} | gmpy2 ERROR: {e}")
-                continue
-        
-        # Time Binet's formula with mpmath
-        binet_iters = min(iterations, 5000) if n < 10000 else min(iterations, 500)
-        binet_time = time_function(fibonacci_binet_mpmath, n, iterations=binet_iters)
-        binet_results.append((n, binet_time))
-        if binet_baseline is None:
-            binet_baseline = binet_time
-        binet_ratio = binet_time / binet_baseline
-        
-        # Time iterative approach (O(n))
-        iter_iters = min(iterations, max(10, 100000 // n))
-        iterative_time = time_function(fibonacci_iterative, n, iterations=iter_iters)
-        iterative_results.append((n, iterative_time))
-        if iter_baseline is None:
-            iter_baseline = iterative_time
-        iter_ratio = iterative_time / iter_baseline
-        
-        # Print results
-        if FASTFIB_AVAILABLE and GMPY2_AVAILABLE:
-            cpp_vs_gmpy2 = gmpy2_time / gmp_time
-            cpp_vs_binet = binet_time / gmp_time
-            print(f"{category:<12} {n:>10,} | {gmp_time:>10.4f} {gmp_ratio:>6.2f}x | "
-                  f"{gmpy2_time:>9.4f} {gmpy2_ratio:>6.2f}x | "
-                  f"{binet_time:>9.4f} {binet_ratio:>6.2f}x | "
-                  f"{iterative_time:>10.4f} {iter_ratio:>6.1f}x | "
-                  f"{cpp_vs_gmpy2:>11.2f}x {cpp_vs_binet:>12.2f}x")
-        elif FASTFIB_AVAILABLE:
-            gmp_vs_binet = binet_time / gmp_time
-            gmp_vs_iter = iterative_time / gmp_time
-            print(f"{category:<12} {n:>10,} | {gmp_time:>9.4f} {gmp_ratio:>6.2f}x | "
-                  f"{binet_time:>10.4f} {binet_ratio:>6.2f}x | "
-                  f"{iterative_time:>11.4f} {iter_ratio:>6.1f}x | "
-                  f"{gmp_vs_binet:>12.2f}x {gmp_vs_iter:>11.0f}x")
-        else:
-            speedup = iterative_time / binet_time
-            print(f"{category:<12} {n:>10,} | {binet_time:>11.4f} {binet_ratio:>7.2f}x | "
-                  f"{iterative_time:>13.4f} {iter_ratio:>7.1f}x | {speedup:>9.1f}x")
+                results[key] = e
+    return results
+
+
+# n values used to show how much of a C++ call is overhead rather than
+# computation: call dispatch dominates at small n, converting the mpz
+# result to a Python int dominates at the top of the test plan
+CALL_OVERHEAD_NS = (100, TEST_PLAN[-1][1])
+
+
+def speed_ratio(ratio):
+    """
+    Describe a time ratio (other / this) as "N.NNx FASTER" or "N.NNx SLOWER".
+    
+    Args:
+        ratio (float): The other algorithm's time divided by this one's
+    
+    Returns:
+        str: The ratio in words
+    """
+    if ratio >= 1:
+        return f"{ratio:.2f}x FASTER"
+    return f"{1 / ratio:.2f}x SLOWER"
+
+
+# Rows from here on carry real big-integer work; below it the columns are
+# dominated by table lookups and call overhead, which would flatten the fit
+SCALING_FIT_MIN_N = 1000
+
+
+def scaling_summary(results):
+    """
+    Describe how one column's time grew across the test plan.
+    
+    Besides the first-to-last growth, fits log(time) against log(n) by
+    least squares over the rows with n >= SCALING_FIT_MIN_N, so the
+    empirical exponent k in time ~ n^k can be read off directly.
+    
+    Args:
+        results (list): (n, time in microseconds) pairs in test plan order
+    
+    Returns:
+        list: Report lines
+    """
+    first_n, first_time = results[0]
+    last_n, last_time = results[-1]
+    lines = [
+        f"  When n increased from {first_n:,} to {last_n:,} ({last_n / first_n:,.0f}x increase)",
+        f"  Time increased from {first_time:.4f}μs to {last_time:.4f}μs ({last_time / first_time:.1f}x increase)",
+    ]
+    
+    points = [(math.log(n), math.log(t)) for n, t in results if n >= SCALING_FIT_MIN_N and t > 0]
+    if len(points) >= 2:
+        mean_x = sum(x for x, _ in points) / len(points)
+        mean_y = sum(y for _, y in points) / len(points)
+        slope = (sum((x - mean_x) * (y - mean_y) for x, y in points)
+                 / sum((x - mean_x) ** 2 for x, _ in points))
+        lines.append(f"  Empirical scaling for n >= {SCALING_FIT_MIN_N:,}: time ~ n^{slope:.2f} (log-log fit)")
+    return lines
+
+
+# Columns whose failure is reported in the table instead of raised
+ERROR_LABELS = {"gmp": "C++ GMP", "gmpy2": "gmpy2"}
+
+
+def _table_cpp_gmpy2():
+    """
+    Table layout with C++ GMP, gmpy2, Binet and iterative columns.
+    
+    Returns:
+        (header, format_row): The header lines, and a function turning
+        (category, n, times, ratios) into a row
+    """
+    header = [
+        f"{'Category':<12} {'n':>10} | {'C++ GMP':>13} {'Ratio':>7} | {'Py gmpy2':>11} {'Ratio':>7} | {'Py Binet':>11} {'Ratio':>7} | {'Py Iter':>12} {'Ratio':>7} | {'C++ vs':>8} | {'C++ vs':>8}",
+        f"{'':12} {'':>10} | {'(fastfib) μs':>13} {'':>7} | {'(GMP) μs':>11} {'':>7} | {'(mpmath) μs':>11} {'':>7} | {'(loop) μs':>12} {'':>7} | {'gmpy2':>8} | {'Binet':>8}",
+    ]
+    
+    def format_row(category, n, t, r):
+        cpp_vs_gmpy2 = t["gmpy2"] / t["gmp"]
+        cpp_vs_binet = t["binet"] / t["gmp"]
+        return (f"{category:<12} {n:>10,} | {t['gmp']:>10.4f} {r['gmp']:>6.2f}x | "
+                f"{t['gmpy2']:>9.4f} {r['gmpy2']:>6.2f}x | "
+                f"{t['binet']:>9.4f} {r['binet']:>6.2f}x | "
+                f"{t['iter']:>10.4f} {r['iter']:>6.1f}x | "
+                f"{cpp_vs_gmpy2:>11.2f}x {cpp_vs_binet:>12.2f}x")
+    
+    return header, format_row
+
+
+def _table_cpp():
+    """
+    Table layout with C++ GMP, Binet and iterative columns.
+    
+    Returns:
+        (header, format_row): The header lines, and a function turning
+        (category, n, times, ratios) into a row
+    """
+    header = [
+        f"{'Category':<12} {'n':>10} | {'C++ GMP':>10} {'Ratio':>7} | {'Py Binet':>11} {'Ratio':>7} | {'Py Iter':>12} {'Ratio':>7} | {'C++ vs Binet':>13} {'C++ vs Iter':>12}",
+        f"{'':12} {'':>10} | {'(fastfib) μs':>10} {'':>7} | {'(mpmath) μs':>11} {'':>7} | {'(loop) μs':>12} {'':>7} | {'':>13} {'':>12}",
+    ]
+    
+    def format_row(category, n, t, r):
+        gmp_vs_binet = t["binet"] / t["gmp"]
+        gmp_vs_iter = t["iter"] / t["gmp"]
+        return (f"{category:<12} {n:>10,} | {t['gmp']:>9.4f} {r['gmp']:>6.2f}x | "
+                f"{t['binet']:>10.4f} {r['binet']:>6.2f}x | "
+                f"{t['iter']:>11.4f} {r['iter']:>6.1f}x | "
+                f"{gmp_vs_binet:>12.2f}x {gmp_vs_iter:>11.0f}x")
+    
+    return header, format_row
+
+
+def _table_python():
+    """
+    Table layout with only the Binet and iterative columns.
+    
+    Returns:
+        (header, format_row): The header lines, and a function turning
+        (category, n, times, ratios) into a row
+    """
+    header = [
+        f"{'Category':<12} {'n':>10} | {'Py Binet':>12} {'Ratio':>8} | {'Py Iterative':>14} {'Ratio':>8} | {'Speedup':>10}",
+        f"{'':12} {'':>10} | {'(mpmath) μs':>12} {'':>8} | {'(loop) μs':>14} {'':>8} | {'':>10}",
+    ]
     
-    print("-" * 130)
-    print()
+    def format_row(category, n, t, r):
+        speedup = t["iter"] / t["binet"]
+        return (f"{category:<12} {n:>10,} | {t['binet']:>11.4f} {r['binet']:>7.2f}x | "
+                f"{t['iter']:>13.4f} {r['iter']:>7.1f}x | {speedup:>9.1f}x")
+    
+    return header, format_row
+
+
+def run_comparison_test(parallel=False, pure_python_gmpy2=False):
+    """
+    Compare C++ GMP vs Python gmpy2 vs Python Binet vs Iterative.
+    
+    Output is collected and written once at the end, so no terminal I/O
+    happens between timing runs.
+    
+    Args:
+        parallel (bool): Spread the timings over one process per core
+        pure_python_gmpy2 (bool): Time the Python fast-doubling loop over
+            gmpy2 values in the gmpy2 column instead of gmpy2.fib
+    """
+    if pure_python_gmpy2:
+        gmpy2_func, gmpy2_desc = fibonacci_gmpy2_loop, "fast doubling loop over gmpy2"
+    else:
+        gmpy2_func, gmpy2_desc = fibonacci_gmpy2, "GMP's mpz_fib_ui via gmpy2"
+    
+    out = []
+    out.append("=" * 160)
+    out.append("FIBONACCI ALGORITHMS COMPARISON")
+    out.append("=" * 160)
+    out.append("")
+    out.append("Comparing four approaches:")
+    out.append("  1. C++ GMP (fastfib)      - Fast Doubling, EXACT arbitrary precision, compiled C++ with GMP")
+    if pure_python_gmpy2:
+        out.append("  2. Python gmpy2           - Fast Doubling, EXACT arbitrary precision, Python loop over GMP values")
+    else:
+        out.append("  2. Python gmpy2           - GMP's mpz_fib_ui via gmpy2.fib, EXACT arbitrary precision, no Python loop")
+    out.append("  3. Python Binet (mpmath)  - Binet's formula, arbitrary precision, pure Python with mpmath")
+    out.append("  4. Python Iterative       - Fast doubling over the bits of n, EXACT, plain Python ints")
+    out.append("")
+    out.append("The 'Ratio' column shows how each algorithm scales as n increases (relative to n=10 baseline)")
+    out.append("")
+    out.append("-" * 160)
+    
+    # The columns, and so the table layout, are fixed at import
+    if FASTFIB_AVAILABLE and GMPY2_AVAILABLE:
+        header, format_row = _table_cpp_gmpy2()
+    elif FASTFIB_AVAILABLE:
+        header, format_row = _table_cpp()
+    else:
+        header, format_row = _table_python()
+    out.extend(header)
+    out.append("-" * 160)
+    
+    # Every timing runs before the table is built. The C++ column goes first,
+    # so its sub-microsecond rows run back to back instead of between long
+    # Python timings.
+    jobs = {}
+    if FASTFIB_AVAILABLE:
+        for _, n in TEST_PLAN:
+            jobs["gmp", n] = (time_fibonacci_cpp, n)
+    for _, n in TEST_PLAN:
+        if GMPY2_AVAILABLE:
+            # The C++ column converts to a Python int once per batch,
+            # so gmpy2 keeps its result as an mpz rather than paying per call
+            jobs["gmpy2", n] = (time_function, gmpy2_func, n, None, {"return_type": "mpz"})
+        jobs["binet", n] = (time_function, fibonacci_binet_mpmath, n)
+        jobs["iter", n] = (time_function, fibonacci_iterative, n)
+    times = run_timing_jobs(jobs, parallel)
+    
+    # Time per row, and the first row's time as the baseline for the ratios
+    columns = [column for column, available in (("gmp", FASTFIB_AVAILABLE),
+                                                ("gmpy2", GMPY2_AVAILABLE),
+                                                ("binet", True),
+                                                ("iter", True)) if available]
+    results = {"gmp": [], "gmpy2": [], "binet": [], "iter": []}
+    baselines = {}
+    
+    for category, n in TEST_PLAN:
+        row_times = {}
+        for column in columns:
+            value = times[column, n]
+            if isinstance(value, Exception):
+                # A missing library build shows up as an error row; the
+                # pure-Python columns failing is a bug, so let it raise
+                if column not in ERROR_LABELS:
+                    raise value
+                out.append(f"{category:<12} {n:>10,} | {ERROR_LABELS[column]} ERROR: {value}")
+                break
+            row_times[column] = value
+        else:
+            ratios = {}
+            for column, value in row_times.items():
+                results[column].append((n, value))
+                baselines.setdefault(column, value)
+                ratios[column] = value / baselines[column]
+            out.append(format_row(category, n, row_times, ratios))
+    
+    gmp_results = results["gmp"]
+    gmpy2_results = results["gmpy2"]
+    binet_results = results["binet"]
+    iterative_results = results["iter"]
+    
+    out.append("-" * 130)
+    out.append("")
+    
+    # Separate the cost of calling into C++ from the computation itself
+    for n in CALL_OVERHEAD_NS if FASTFIB_AVAILABLE else ():
+        per_call = time_function(fibonacci_gmp, n)
+        compute = time_fibonacci_cpp(n)
+        fibonacci_gmp_cached(n)
+        floor = time_function(fibonacci_gmp_cached, n)
+        
+        out.append(f"CALL OVERHEAD (n={n:,}):")
+        out.append(f"  C++ GMP called from Python:  {per_call:>10.4f} μs  (computation + int conversion)")
+        out.append(f"  C++ GMP compute only:        {compute:>10.4f} μs  (loop inside C++, one conversion per batch)")
+        out.append(f"  Memoized call (call floor):  {floor:>10.4f} μs  (no C++ call at all)")
+        out.append(f"  → {max(0.0, 1 - compute / per_call):.0%} of a single call from Python is call and conversion overhead")
+        out.append("")
     
     # Analysis
-    print("ANALYSIS:")
-    print("=" * 130)
-    print()
+    out.append("ANALYSIS:")
+    out.append("=" * 130)
+    out.append("")
     
     # GMP Analysis
     if FASTFIB_AVAILABLE and len(gmp_results) >= 2:
-        first_n, first_gmp = gmp_results[0]
-        last_n, last_gmp = gmp_results[-1]
-        n_ratio = last_n / first_n
-        gmp_ratio = last_gmp / first_gmp
-        
-        print("1. C++ GMP (fastfib) - FAST DOUBLING ALGORITHM:")
-        print(f"  When n increased from {first_n:,} to {last_n:,} ({n_ratio:,.0f}x increase)")
-        print(f"  Time increased from {first_gmp:.4f}μs to {last_gmp:.4f}μs ({gmp_ratio:.1f}x increase)")
-        print(f"  ✓ O(log n) multiplications, but each multiplication gets slower as numbers grow")
-        print(f"  ✓ Returns EXACT arbitrary-precision integers (no overflow!)")
-        print(f"  ✓ Compiled C++ with GMP library - High performance")
-        print()
+        out.append("1. C++ GMP (fastfib) - FAST DOUBLING ALGORITHM:")
+        out.extend(scaling_summary(gmp_results))
+        out.append(f"  ✓ O(log n) multiplications, but each multiplication gets slower as numbers grow")
+        out.append(f"  ✓ Returns EXACT arbitrary-precision integers (no overflow!)")
+        out.append(f"  ✓ Compiled C++ with GMP library - High performance")
+        out.append("")
     
     # gmpy2 Analysis
     if GMPY2_AVAILABLE and len(gmpy2_results) >= 2:
-        first_n, first_gmpy2 = gmpy2_results[0]
-        last_n, last_gmpy2 = gmpy2_results[-1]
-        n_ratio = last_n / first_n
-        gmpy2_ratio = last_gmpy2 / first_gmpy2
-        
-        print("2. Python gmpy2 - FAST DOUBLING WITH GMP BINDINGS:")
-        print(f"  When n increased from {first_n:,} to {last_n:,} ({n_ratio:,.0f}x increase)")
-        print(f"  Time increased from {first_gmpy2:.4f}μs to {last_gmpy2:.4f}μs ({gmpy2_ratio:.1f}x increase)")
-        print(f"  ✓ Same fast doubling algorithm as C++, with Python interpreter overhead")
-        print(f"  ✓ Uses GMP library through Python bindings - Still very fast!")
-        print(f"  ✓ Returns EXACT arbitrary-precision integers")
-        print()
+        if pure_python_gmpy2:
+            out.append("2. Python gmpy2 - FAST DOUBLING WITH GMP BINDINGS:")
+        else:
+            out.append("2. Python gmpy2 - GMP'S BUILT-IN FIBONACCI (mpz_fib_ui):")
+        out.extend(scaling_summary(gmpy2_results))
+        if pure_python_gmpy2:
+            out.append(f"  ✓ Same fast doubling algorithm as C++, with Python interpreter overhead")
+            out.append(f"  ✓ Uses GMP library through Python bindings - Still very fast!")
+        else:
+            out.append(f"  ✓ One call into GMP's dedicated Fibonacci routine, no Python-level loop")
+            out.append(f"  ✓ Same doubling recurrences as C++, with GMP's tuned squaring code")
+        out.append(f"  ✓ Returns EXACT arbitrary-precision integers")
+        out.append("")
     
     # Binet Analysis
     if len(binet_results) >= 2:
-        first_n, first_binet = binet_results[0]
-        last_n, last_binet = binet_results[-1]
-        n_ratio = last_n / first_n
-        binet_ratio = last_binet / first_binet
-        
-        print("3. Python Binet (mpmath) - BINET'S FORMULA:")
-        print(f"  When n increased from {first_n:,} to {last_n:,} ({n_ratio:,.0f}x increase)")
-        print(f"  Time increased from {first_binet:.4f}μs to {last_binet:.4f}μs ({binet_ratio:.1f}x increase)")
-        print(f"  ✓ Uses mpmath library for arbitrary precision arithmetic")
-        print(f"  ✓ Scales with precision needed (~O(log n))")
-        print()
+        out.append("3. Python Binet (mpmath) - BINET'S FORMULA:")
+        out.extend(scaling_summary(binet_results))
+        out.append(f"  ✓ Native doubles up to n={BINET_FLOAT_MAX_N}, mpmath arbitrary precision above")
+        out.append(f"  ✓ Working precision grows with n (~0.69n bits), then one rounding step")
+        out.append("")
     
     # Iterative Analysis
     if len(iterative_results) >= 2:
-        first_n, first_iter = iterative_results[0]
-        last_n, last_iter = iterative_results[-1]
-        n_ratio = last_n / first_n
-        iter_ratio = last_iter / first_iter
+        out.append("4. Python Iterative - FAST DOUBLING WITH PLAIN PYTHON INTS:")
+        out.extend(scaling_summary(iterative_results))
+        out.append(f"  ✓ Loop over the bits of n, doubling (F(k), L(k)) each step")
+        out.append(f"  ✓ O(log n) steps, using CPython's built-in big integers")
+        out.append("")
+    
+    # Winner, ranked by the times measured above
+    out.append("CONCLUSION:")
+    if results[columns[0]]:
+        labels = {"gmp": "C++ GMP (fastfib)",
+                  "gmpy2": "Python gmpy2",
+                  "binet": "Python Binet (mpmath)",
+                  "iter": "Python Iterative"}
+        descriptions = {"gmp": "EXACT, compiled C++ with GMP library",
+                        "gmpy2": f"EXACT, {gmpy2_desc}",
+                        "binet": "arbitrary precision, pure Python",
+                        "iter": "EXACT, fast doubling on CPython ints"}
         
-        print("4. Python Iterative - SIMPLE LOOP:")
-        print(f"  When n increased from {first_n:,} to {last_n:,} ({n_ratio:,.0f}x increase)")
-        print(f"  Time increased from {first_iter:.4f}μs to {last_iter:.4f}μs ({iter_ratio:.1f}x increase)")
-        print(f"  ✓ Classic for-loop adding consecutive Fibonacci numbers")
-        print(f"  ✓ LINEAR scaling - time grows proportionally with n")
-        print()
-    
-    # Winner
-    print("CONCLUSION:")
-    if FASTFIB_AVAILABLE and GMPY2_AVAILABLE and gmp_results and gmpy2_results and binet_results and iterative_results:
         # Find a good comparison point
-        compare_idx = min(5, len(gmp_results) - 1)
-        n_compare, gmp_compare = gmp_results[compare_idx]
-        _, gmpy2_compare = gmpy2_results[compare_idx]
-        _, binet_compare = binet_results[compare_idx]
-        _, iter_compare = iterative_results[compare_idx]
-        cpp_vs_gmpy2 = gmpy2_compare / gmp_compare
-        cpp_vs_binet = binet_compare / gmp_compare
-        gmpy2_vs_binet = binet_compare / gmpy2_compare
+        compare_idx = min(5, len(results[columns[0]]) - 1)
+        n_compare = results[columns[0]][compare_idx][0]
+        ranking = sorted(columns, key=lambda column: results[column][compare_idx][1])
+        fastest_time = results[ranking[0]][compare_idx][1]
         
-        print(f"  Performance Comparison at n={n_compare:,}:")
-        print(f"    - C++ GMP (fastfib)    is {cpp_vs_gmpy2:.2f}x FASTER than Python gmpy2 (GMP bindings)")
-        print(f"    - C++ GMP (fastfib)    is {cpp_vs_binet:.2f}x FASTER than Python Binet (mpmath)")
-        print(f"    - Python gmpy2 (GMP)   is {gmpy2_vs_binet:.2f}x FASTER than Python Binet (mpmath)")
-        print()
-        print("  🏆 OVERALL WINNER: C++ GMP (fastfib) - EXACT + FASTEST!")
-        print("  🥈 RUNNER-UP: Python gmpy2 - Fast doubling in pure Python!")
-        print()
-        print("  Ranking by speed (fastest to slowest):")
-        print("    1. C++ GMP (fastfib)     - O(log n), EXACT, compiled C++ with GMP library")
-        print("    2. Python gmpy2          - O(log n), EXACT, Python with GMP bindings")
-        print("    3. Python Binet (mpmath) - O(log n), arbitrary precision, pure Python")
-        print("    4. Python Iterative      - O(n), EXACT, simple loop but slow for large n")
-        print()
-        print("  Key Insights:")
-        print("    ✓ C++ GMP is ~2-4x faster than Python gmpy2 (interpreter overhead)")
-        print("    ✓ Python gmpy2 is ~5-10x faster than Python Binet (GMP vs pure Python mpmath)")
-        print("    ✓ Both C++ GMP and Python gmpy2 give EXACT arbitrary-precision results")
-        print("    ✓ Fast doubling algorithm works great in both C++ and Python!")
-        print("    ✓ If you need Python: use gmpy2 - it's accessible and fast!")
-    elif FASTFIB_AVAILABLE and gmp_results and binet_results and iterative_results:
-        # Find a good comparison point
-        compare_idx = min(5, len(gmp_results) - 1)
-        n_compare, gmp_compare = gmp_results[compare_idx]
-        _, binet_compare = binet_results[compare_idx]
-        _, iter_compare = iterative_results[compare_idx]
-        gmp_vs_binet = binet_compare / gmp_compare
-        gmp_vs_iter = iter_compare / gmp_compare
-        binet_vs_iter = iter_compare / binet_compare
+        out.append(f"  Performance Comparison at n={n_compare:,}:")
+        for column in ranking[1:]:
+            ratio = results[column][compare_idx][1] / fastest_time
+            out.append(f"    - {labels[ranking[0]]:<22} is {speed_ratio(ratio)} than {labels[column]}")
+        out.append("")
+        out.append(f"  🏆 FASTEST: {labels[ranking[0]]} - {descriptions[ranking[0]]}")
+        out.append("")
+        out.append("  Ranking by speed (fastest to slowest):")
+        for place, column in enumerate(ranking, 1):
+            time_us = results[column][compare_idx][1]
+            out.append(f"    {place}. {labels[column]:<22} - {time_us:>12.4f} μs, {descriptions[column]}")
         
-        print(f"  Performance Comparison at n={n_compare:,}:")
-        print(f"    - C++ GMP (fastfib)    is {gmp_vs_binet:.2f}x FASTER than Python Binet (mpmath)")
-        print(f"    - C++ GMP (fastfib)    is {gmp_vs_iter:.0f}x FASTER than Python Iterative")
-        print(f"    - Python Binet (mpmath) is {binet_vs_iter:.1f}x FASTER than Python Iterative")
-        print()
-        print("  🏆 OVERALL WINNER: C++ GMP (fastfib) - EXACT + FAST!")
-        print()
-        print("  Ranking by speed (fastest to slowest):")
-        print("    1. C++ GMP (fastfib)     - O(log n), EXACT arbitrary precision, compiled with GMP")
-        print("    2. Python Binet (mpmath) - O(log n), arbitrary precision, pure Python")
-        print("    3. Python Iterative      - O(n), EXACT, simple loop but slow for large n")
+        # How the gap between each pair changes from the smallest n to the largest
+        if len(results[columns[0]]) >= 2:
+            out.append("")
+            out.append(f"  Ratios from n={results[columns[0]][0][0]:,} to n={results[columns[0]][-1][0]:,}:")
+            for column in ranking[1:]:
+                first = results[column][0][1] / results[ranking[0]][0][1]
+                last = results[column][-1][1] / results[ranking[0]][-1][1]
+                out.append(f"    - {labels[ranking[0]]:<22} vs {labels[column]:<22}: "
+                           f"{speed_ratio(first)} → {speed_ratio(last)}")
+    
+    out.append("=" * 130)
+    
+    sys.stdout.write("\n".join(out) + "\n")
+
+
+# log10(2), to estimate a decimal digit count from a bit length
+LOG10_2 = 0.30102999566398120
+
+
+def abbreviate_int(value, edge=50):
+    """
+    Describe a non-negative int by its leading and trailing decimal digits.
+    
+    str() of a huge int is quadratic in CPython, so for values longer than
+    2 * edge digits only the two ends are converted: the digit count comes
+    from the bit length (corrected by one comparison) and the ends from a
+    floor division and a remainder by powers of ten. With gmpy2 that
+    arithmetic runs on mpz values, where GMP's subquadratic powering and
+    division make it several times faster again.
+    
+    Args:
+        value (int): The number to describe (value >= 0)
+        edge (int): Digits to show at each end
     
-    print("=" * 130)
+    Returns:
+        tuple: (text, digit_count), where text is the full number or
+            "<head>...<tail>"
+    """
+    if GMPY2_AVAILABLE:
+        value, ten = gmpy2.mpz(value), gmpy2.mpz(10)
+    else:
+        ten = 10
+    
+    # The estimate is exact or one too high
+    digits = int(value.bit_length() * LOG10_2) + 1
+    power = ten ** (digits - 1)
+    if value < power and digits > 1:
+        digits -= 1
+        power //= ten
+    
+    if digits <= 2 * edge:
+        text = str(value)
+        return text, len(text)
+    
+    head = value // (power // ten ** (edge - 1))
+    tail = int(value % ten ** edge)
+    return f"{head}...{tail:0{edge}d}", digits
 
 
 if __name__ == "__main__":
@@ -443,65 +870,105 @@ if __name__ == "__main__":
         type=int,
         help="Compute and time a specific Fibonacci number with all available algorithms"
     )
+    parser.add_argument(
+        "--pure-python-gmpy2",
+        action="store_true",
+        help="Time a Python fast-doubling loop over gmpy2 values in the gmpy2 column "
+             "instead of gmpy2.fib (GMP's own mpz_fib_ui), for reference"
+    )
+    parser.add_argument(
+        "--parallel",
+        action="store_true",
+        help="Spread the comparison timings over one process per CPU core (faster, "
+             "but timings running side by side can disturb each other)"
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Memoize every algorithm so repeated F(n) are lookups (for using the "
+             "results as test vectors; -n skips its timings, and comparison timings "
+             "then measure the cache)"
+    )
     
     args = parser.parse_args()
     
+    if args.cache:
+        memoize_algorithms()
+    
     if args.n is not None:
         # Single computation mode
         print(f"\n{'='*80}")
         print(f"Computing F({args.n}) with all available algorithms")
         print(f"{'='*80}\n")
         
-        # Compute with all methods
-        result_binet = fibonacci_binet_mpmath(args.n)
-        result_iter = fibonacci_iterative(args.n)
+        # Compute with all methods (each first call also sizes its timing run)
+        result_binet, binet_iters = call_and_size(fibonacci_binet_mpmath, args.n)
+        result_mpfib, mpfib_iters = call_and_size(fibonacci_mpmath_fib, args.n)
+        result_iter, iter_iters = call_and_size(fibonacci_iterative, args.n)
         
         if FASTFIB_AVAILABLE:
-            result_gmp = fibonacci_gmp(args.n)
+            result_gmp, gmp_iters = call_and_size(fibonacci_gmp, args.n)
+        
+        # gmpy2 stays an mpz: it compares equal to an int without conversion
+        gmpy2_kwargs = {"return_type": "mpz"}
+        if GMPY2_AVAILABLE:
+            result_gmpy2, gmpy2_iters = call_and_size(fibonacci_gmpy2, args.n, gmpy2_kwargs)
         
         # Verify they give the same result
-        all_match = result_binet == result_iter
+        all_match = result_binet == result_iter == result_mpfib
         if FASTFIB_AVAILABLE:
             all_match = all_match and (result_gmp == result_binet)
+        if GMPY2_AVAILABLE:
+            all_match = all_match and (result_gmpy2 == result_binet)
         
         if not all_match:
             print("⚠️  WARNING: Algorithms produced different results!")
             print(f"Python Binet (mpmath):    {result_binet}")
+            print(f"Python mpmath (ifib):     {result_mpfib}")
             print(f"Python Iterative:         {result_iter}")
             if FASTFIB_AVAILABLE:
                 print(f"C++ GMP (fastfib):        {result_gmp}")
+            if GMPY2_AVAILABLE:
+                print(f"Python gmpy2 (GMP):       {result_gmpy2}")
         else:
-            result_str = str(result_binet)
-            if len(result_str) <= 100:
-                print(f"Result: F({args.n}) = {result_str}")
-            else:
-                print(f"Result: F({args.n}) = {result_str[:50]}...{result_str[-50:]}")
-                print(f"        ({len(result_str)} digits)")
+            result_str, digit_count = abbreviate_int(result_binet)
+            print(f"Result: F({args.n}) = {result_str}")
+            if digit_count > 100:
+                print(f"        ({digit_count} digits)")
             if FASTFIB_AVAILABLE:
                 print(f"✓ All methods agree! EXACT value.")
         
-        # Time all algorithms
-        print(f"\n{'Timing Results:':-^80}\n")
-        
-        iterations = max(10, min(10000, 100000 // max(1, args.n)))
-        
-        if FASTFIB_AVAILABLE:
-            time_gmp = time_function(fibonacci_gmp, args.n, iterations=min(iterations, 1000))
-            print(f"C++ GMP (fastfib):        {time_gmp:>10.4f} μs  [EXACT + FASTEST]")
-        
-        time_binet = time_function(fibonacci_binet_mpmath, args.n, iterations=iterations)
-        time_iter = time_function(fibonacci_iterative, args.n, iterations=iterations)
-        
-        print(f"Python Binet (mpmath):    {time_binet:>10.4f} μs")
-        print(f"Python Iterative (loop):  {time_iter:>10.4f} μs")
-        
-        print(f"\n{'Speedup Comparisons:':-^80}\n")
-        if FASTFIB_AVAILABLE:
-            print(f"C++ GMP vs Python Binet:     {time_binet/time_gmp:>6.2f}x faster")
-            print(f"C++ GMP vs Python Iterative: {time_iter/time_gmp:>6.0f}x faster")
-        print(f"Python Binet vs Iterative:   {time_iter/time_binet:>6.1f}x faster")
+        # With --cache the value is what is wanted; timings would only measure the cache
+        if not args.cache:
+            # Time all algorithms
+            print(f"\n{'Timing Results:':-^80}\n")
+            
+            if FASTFIB_AVAILABLE:
+                time_gmp = time_fibonacci_cpp(args.n, iterations=gmp_iters)
+                print(f"C++ GMP (fastfib):        {time_gmp:>10.4f} μs  [EXACT, compiled fast doubling]")
+            
+            if GMPY2_AVAILABLE:
+                time_gmpy2 = time_function(fibonacci_gmpy2, args.n, gmpy2_iters, gmpy2_kwargs)
+                print(f"Python gmpy2 (GMP):       {time_gmpy2:>10.4f} μs  [EXACT, GMP's mpz_fib_ui]")
+            
+            time_binet = time_function(fibonacci_binet_mpmath, args.n, iterations=binet_iters)
+            time_mpfib = time_function(fibonacci_mpmath_fib, args.n, iterations=mpfib_iters)
+            time_iter = time_function(fibonacci_iterative, args.n, iterations=iter_iters)
+            
+            print(f"Python Binet (mpmath):    {time_binet:>10.4f} μs")
+            print(f"Python mpmath (ifib):     {time_mpfib:>10.4f} μs  [EXACT, mpmath's integer routine]")
+            print(f"Python Iterative (loop):  {time_iter:>10.4f} μs")
+            
+            print(f"\n{'Speedup Comparisons:':-^80}\n")
+            if FASTFIB_AVAILABLE and GMPY2_AVAILABLE:
+                print(f"C++ GMP vs Python gmpy2:     {speed_ratio(time_gmpy2 / time_gmp)}")
+            if FASTFIB_AVAILABLE:
+                print(f"C++ GMP vs Python Binet:     {speed_ratio(time_binet / time_gmp)}")
+                print(f"C++ GMP vs Python Iterative: {speed_ratio(time_iter / time_gmp)}")
+            print(f"Python Binet vs Iterative:   {speed_ratio(time_iter / time_binet)}")
+            print(f"mpmath ifib vs Python Binet: {speed_ratio(time_binet / time_mpfib)}")
         print(f"\n{'='*80}\n")
     else:
         # Default: run comparison test
-        run_comparison_test()
+        run_comparison_test(parallel=args.parallel, pure_python_gmpy2=args.pure_python_gmpy2)
 